@@ -5,12 +5,207 @@ Loads and indexes Pokemon data from cache files for efficient lookups.
 """
 
 import json
+import mmap
+import os
+import pickle
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 CACHE_DIR = Path(__file__).parent / "cache"
 
+# Set to a non-empty value to keep parsed data in *.pkl files next to the JSON
+PICKLE_CACHE_ENV = "MCPKMN_PICKLE_CACHE"
+
+# Files at least this large are memory-mapped rather than read into a buffer
+_MMAP_MIN_BYTES = 256 * 1024
+
+
+# Characters stripped from names before lookup
+_NORM_TABLE = str.maketrans("", "", " -.'")
+_NORM_TABLE_PUNCT = str.maketrans("", "", ".':")
+# Words of a Pokemon name, split on whitespace and dashes
+_NAME_WORD_RE = re.compile(r"[^\s-]+")
+
+# Stat names accepted by search_pokemon_by_stat -> baseStats key
+_STAT_KEYS = {
+    "hp": "hp", "atk": "atk", "attack": "atk",
+    "def": "def", "defense": "def",
+    "spa": "spa", "spatk": "spa", "special_attack": "spa",
+    "spd": "spd", "spdef": "spd", "special_defense": "spd",
+    "spe": "spe", "speed": "spe",
+}
+
+# Prefix -> suffix mapping for Pokemon forms
+_FORM_PREFIXES = {
+    "mega": "mega",
+    "primal": "primal",
+    "alolan": "alola",
+    "alola": "alola",
+    "galarian": "galar",
+    "galar": "galar",
+    "hisuian": "hisui",
+    "hisui": "hisui",
+    "paldean": "paldea",
+    "paldea": "paldea",
+    "gigantamax": "gmax",
+    "gmax": "gmax",
+    "black": "black",
+    "white": "white",
+    "origin": "origin",
+    "shadow": "shadow",
+}
+
+
+# Move effect categories for search_moves_by_effect
+_MOVE_EFFECT_CATEGORIES: dict[str, dict[str, Any]] = {
+    "spread": {
+        "desc": "Moves that hit multiple targets",
+        "flags": (),
+        "targets": frozenset({"allAdjacentFoes", "allAdjacent", "all"}),
+    },
+    "priority": {
+        "desc": "Moves with increased priority",
+        "flags": (),
+        "targets": frozenset(),
+    },
+    "recovery": {
+        "desc": "Moves that restore HP",
+        "keywords": ("heal", "recover", "restore", "drain"),
+        "moves": frozenset({
+            "recover", "softboiled", "roost", "moonlight", "morningsun",
+            "synthesis", "shoreup", "slackoff", "milkdrink", "wish",
+            "healorder", "junglehealing", "lunarblessing", "lifedew",
+            "strengthsap",
+        }),
+    },
+    "setup": {
+        "desc": "Stat-boosting moves",
+        "moves": frozenset({
+            "swordsdance", "nastyplot", "calmmind", "dragondance",
+            "bulkup", "irondefense", "amnesia", "agility", "rockpolish",
+            "shellsmash", "quiverdance", "coil", "curse",
+            "tailglow", "geomancy", "shiftgear", "tidyup",
+            "victorydance", "clangoroussoul", "noretreat",
+            "bellydrum", "filletaway",
+        }),
+    },
+    "hazard": {
+        "desc": "Entry hazard moves",
+        "moves": frozenset({
+            "stealthrock", "spikes", "toxicspikes", "stickyweb",
+            "caltrop",
+        }),
+    },
+    "hazard_removal": {
+        "desc": "Moves that remove entry hazards",
+        "moves": frozenset({"rapidspin", "defog", "courtchange", "tidyup", "mortalspin"}),
+    },
+    "weather": {
+        "desc": "Weather-setting moves",
+        "moves": frozenset({
+            "sunnyday", "raindance", "sandstorm", "snowscape", "hail",
+        }),
+    },
+    "terrain": {
+        "desc": "Terrain-setting moves",
+        "moves": frozenset({
+            "electricterrain", "grassyterrain", "mistyterrain",
+            "psychicterrain",
+        }),
+    },
+    "screen": {
+        "desc": "Damage-reducing screens",
+        "moves": frozenset({"reflect", "lightscreen", "auroraveil"}),
+    },
+    "pivot": {
+        "desc": "Moves that switch the user out",
+        "moves": frozenset({
+            "uturn", "voltswitch", "flipturn", "partingshot",
+            "batonpass", "teleport", "shedtail", "chillyreception",
+        }),
+    },
+    "speed_control": {
+        "desc": "Moves that affect speed order",
+        "moves": frozenset({
+            "tailwind", "trickroom", "icywind", "electroweb",
+            "stringshot", "stickyweb", "thunderwave", "glare",
+            "bulldoze", "rockslide", "scaryface",
+        }),
+    },
+    "redirection": {
+        "desc": "Moves that redirect attacks in doubles",
+        "moves": frozenset({"followme", "ragepowder", "spotlight", "allyswitch"}),
+    },
+    "protect": {
+        "desc": "Protection moves",
+        "moves": frozenset({
+            "protect", "detect", "spikyshield", "kingsshield",
+            "banefulbunker", "obstruct", "silktrap", "burningbulwark",
+            "wideguard", "quickguard", "matblock",
+        }),
+    },
+}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_pokemon_name(name: str) -> str:
+    """Normalize Pokemon name, handling forms like 'Mega Charizard Y'."""
+    # Interned so lookups against the (interned) dex keys compare by identity
+    return sys.intern(_pokemon_key(name))
+
+
+def _pokemon_key(name: str) -> str:
+    """Uncached body of _normalize_pokemon_name."""
+    # Remove periods and other punctuation (for Mr. Mime, etc.)
+    name_lower = name.lower().strip().translate(_NORM_TABLE_PUNCT)
+    words = _NAME_WORD_RE.findall(name_lower)
+
+    if not words:
+        return ""
+
+    # Check if first word is a form prefix
+    suffix = _FORM_PREFIXES.get(words[0])
+    if suffix is None:
+        # Default normalization
+        return name_lower.translate(_NORM_TABLE)
+
+    if len(words) == 1:
+        return suffix
+
+    pokemon_name = words[1]
+    extra_parts = "".join(words[2:]) if len(words) > 2 else ""
+
+    # Special case: "mega X Y" -> "xmegay" (for Charizard/Mewtwo forms)
+    if suffix == "mega" and extra_parts and extra_parts in ('x', 'y'):
+        return pokemon_name + "mega" + extra_parts
+
+    # Format: pokemon + suffix + extra (e.g., "tauros" + "paldea" + "combat")
+    return pokemon_name + suffix + extra_parts
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Basic normalization for moves, abilities, items."""
+    return sys.intern(name.lower().translate(_NORM_TABLE))
+
+
+# Per-stat search columns, all in ascending stat order: stat values,
+# Pokemon ids, lowercase tiers and type bitmasks
+_StatColumns = tuple[list[int], list[str], list[str], list[int]]
+
 
 class PokemonDataLoader:
     """
@@ -22,88 +217,192 @@ class PokemonDataLoader:
     - abilities_full.json: Ability descriptions
     - items.json: Item descriptions
     - typechart.json: Type effectiveness
+
+    Lookups and searches return the loader's own data dicts (and memoized
+    search results) rather than copies, so callers must treat them as
+    read-only; copy a result before modifying it.
     """
 
+    FORM_PREFIXES = _FORM_PREFIXES
+    MOVE_EFFECT_CATEGORIES = _MOVE_EFFECT_CATEGORIES
+
     def __init__(self):
         self.pokemon: dict[str, Any] = {}
         self.moves: dict[str, Any] = {}
         self.abilities: dict[str, Any] = {}
         self.items: dict[str, Any] = {}
         self.typechart: dict[str, Any] = {}
+        self._type_index: dict[str, int] = {}
+        self._eff_matrix: list[list[float]] = []
+        self._loaded_pokemon = False
+        self._loaded_moves = False
+        self._loaded_abilities = False
+        self._loaded_items = False
+        self._loaded_typechart = False
+        # Set once load_all has loaded every file and built the indexes
         self._loaded = False
+        self._ability_index: dict[str, list[str]] | None = None
+        self._moves_by_type: dict[str, list[dict]] = {}
+        self._move_ids_by_type: dict[str, tuple[str, ...]] = {}
+        self._move_entries: list[dict] = []
+        self._moves_by_priority: list[dict] = []
+        self._priority_keys: list[int] = []
+        self._indexed_moves = False
+        self._stat_index: dict[str, _StatColumns] = {}
+        self._type_bits: dict[str, int] = {}
+        # Memoized searches are bound per instance so they die with the loader
+        self._cached_stat_search = lru_cache(maxsize=256)(self._search_pokemon_by_stat)
+        self._cached_effect_search = lru_cache(maxsize=256)(self._search_moves_by_effect)
+        # Sized for every attacker x one- or two-type defender spelling in use
+        self._cached_effectiveness = lru_cache(maxsize=8192)(self._type_effectiveness)
 
     def load_all(self) -> None:
-        """Load all data files."""
+        """Load all data files and build the search indexes."""
         if self._loaded:
             return
-
-        self.pokemon = self._load_json("pokedex.json")
-        self.moves = self._load_json("moves_showdown.json")
-        self.abilities = self._load_json("abilities_full.json")
-        self.items = self._load_json("items.json")
-        self.typechart = self._load_json("typechart.json")
-
+        loaders = (
+            self._ensure_pokemon,
+            self._ensure_moves,
+            self._ensure_abilities,
+            self._ensure_items,
+            self._ensure_typechart,
+        )
+        # Each file fills its own attributes, so the reads can overlap
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [executor.submit(load) for load in loaders]
+            for future in futures:
+                future.result()
+        # Build the lookup indexes now so the first search doesn't pay for them
+        self._build_ability_index()
+        self._ensure_move_indexes()
         self._loaded = True
 
+    def _ensure_pokemon(self) -> None:
+        """Load pokedex.json on first use."""
+        if not self._loaded_pokemon:
+            self.pokemon = self._load_json("pokedex.json")
+            self._prepare_pokemon()
+            self._loaded_pokemon = True
+
+    def _ensure_moves(self) -> None:
+        """Load moves_showdown.json on first use."""
+        if not self._loaded_moves:
+            self.moves = self._load_json("moves_showdown.json")
+            self._prepare_moves()
+            self._loaded_moves = True
+
+    def _ensure_abilities(self) -> None:
+        """Load abilities_full.json on first use."""
+        if not self._loaded_abilities:
+            self.abilities = self._load_json("abilities_full.json")
+            self._loaded_abilities = True
+
+    def _ensure_items(self) -> None:
+        """Load items.json on first use."""
+        if not self._loaded_items:
+            self.items = self._load_json("items.json")
+            self._loaded_items = True
+
+    def _ensure_typechart(self) -> None:
+        """Load typechart.json on first use."""
+        if not self._loaded_typechart:
+            # Lowercase once so lookups never have to normalize chart keys
+            self.typechart = {
+                defend.lower(): {atk.lower(): eff for atk, eff in row.items()}
+                for defend, row in self._load_json("typechart.json").items()
+            }
+            # Dense defend x attack matrix for bulk lookups by type index
+            self._type_index = {name: i for i, name in enumerate(self.typechart)}
+            self._eff_matrix = [
+                [row.get(attack, 1.0) for attack in self._type_index]
+                for row in self.typechart.values()
+            ]
+            self._loaded_typechart = True
+
+    def _prepare_pokemon(self) -> None:
+        """Store each Pokemon's base stat total and intern its types, tier and abilities."""
+        intern = sys.intern
+        type_names = set()
+        for poke_data in self.pokemon.values():
+            poke_data["_bst"] = sum(poke_data.get("baseStats", {}).values())
+            if "tier" in poke_data:
+                poke_data["tier"] = intern(poke_data["tier"])
+            if "types" in poke_data:
+                poke_data["types"] = [intern(t) for t in poke_data["types"]]
+                type_names.update(t.lower() for t in poke_data["types"])
+            if "abilities" in poke_data:
+                poke_data["abilities"] = {
+                    slot: intern(ability)
+                    for slot, ability in poke_data["abilities"].items()
+                }
+        # One bit per type, assigned in a single step so searches running in
+        # different threads always agree on the bits
+        self._type_bits = {name: 1 << i for i, name in enumerate(sorted(type_names))}
+
+    def _prepare_moves(self) -> None:
+        """Tag each move with its id and intern its type, category and target."""
+        intern = sys.intern
+        for move_id, move_data in self.moves.items():
+            move_data["id"] = move_id
+            # Searches sort on these, so guarantee they are present
+            move_data.setdefault("priority", 0)
+            move_data.setdefault("basePower", 0)
+            for field in ("type", "category", "target"):
+                if field in move_data:
+                    move_data[field] = intern(move_data[field])
+
     def _load_json(self, filename: str) -> dict:
-        """Load a JSON file from cache directory."""
+        """Load a JSON file from cache directory, interning its top-level keys."""
+        intern = sys.intern
+        return {intern(key): value for key, value in self._read_json(filename).items()}
+
+    def _read_json(self, filename: str) -> dict:
+        """Read a JSON file, or its pickle sidecar when enabled."""
         filepath = CACHE_DIR / filename
         if not filepath.exists():
             print(f"Warning: {filename} not found")
             return {}
 
-        with open(filepath) as f:
-            return json.load(f)
-
-    # Prefix -> suffix mapping for Pokemon forms
-    FORM_PREFIXES = {
-        "mega": "mega",
-        "primal": "primal",
-        "alolan": "alola",
-        "alola": "alola",
-        "galarian": "galar",
-        "galar": "galar",
-        "hisuian": "hisui",
-        "hisui": "hisui",
-        "paldean": "paldea",
-        "paldea": "paldea",
-        "gigantamax": "gmax",
-        "gmax": "gmax",
-        "black": "black",
-        "white": "white",
-        "origin": "origin",
-        "shadow": "shadow",
-    }
-
-    def _normalize_pokemon_name(self, name: str) -> str:
-        """Normalize Pokemon name, handling forms like 'Mega Charizard Y'."""
-        name_lower = name.lower().strip()
-        # Remove periods and other punctuation (for Mr. Mime, etc.)
-        name_lower = name_lower.replace(".", "").replace("'", "").replace(":", "")
-        words = name_lower.replace("-", " ").split()
-
-        if not words:
-            return ""
-
-        # Check if first word is a form prefix
-        if words[0] in self.FORM_PREFIXES:
-            suffix = self.FORM_PREFIXES[words[0]]
-
-            if len(words) == 1:
-                return suffix
-
-            pokemon_name = words[1]
-            extra_parts = "".join(words[2:]) if len(words) > 2 else ""
-
-            # Special case: "mega X Y" -> "xmegay" (for Charizard/Mewtwo forms)
-            if suffix == "mega" and extra_parts and extra_parts in ('x', 'y'):
-                return pokemon_name + "mega" + extra_parts
-
-            # Format: pokemon + suffix + extra (e.g., "tauros" + "paldea" + "combat")
-            return pokemon_name + suffix + extra_parts
-
-        # Default normalization
-        return name_lower.replace(" ", "").replace("-", "")
+        if not os.environ.get(PICKLE_CACHE_ENV):
+            return self._parse_json(filepath)
+
+        # Reuse the pickled copy while it is at least as new as the JSON
+        pickle_path = filepath.with_suffix(".pkl")
+        try:
+            if pickle_path.stat().st_mtime >= filepath.stat().st_mtime:
+                return pickle.loads(pickle_path.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        data = self._parse_json(filepath)
+        self._write_pickle(pickle_path, data)
+        return data
+
+    def _parse_json(self, filepath: Path) -> dict:
+        """Parse a JSON file, preferring orjson when installed."""
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # An empty file holds no entries (and mmap rejects zero length)
+            if size == 0:
+                return {}
+            if orjson is None:
+                return json.load(f)
+            if size < _MMAP_MIN_BYTES:
+                return orjson.loads(f.read())
+            # Parse straight from the page cache instead of a heap copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    def _write_pickle(self, pickle_path: Path, data: dict) -> None:
+        """Atomically write a pickle sidecar, ignoring unwritable cache dirs."""
+        tmp_path = pickle_path.with_suffix(f".pkl.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, pickle_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
 
     def get_pokemon(self, name: str) -> dict | None:
         """
@@ -115,14 +414,10 @@ class PokemonDataLoader:
         Returns:
             Pokemon data dict or None if not found
         """
-        self.load_all()
-        key = self._normalize_pokemon_name(name)
+        self._ensure_pokemon()
+        key = _normalize_pokemon_name(name)
         return self.pokemon.get(key)
 
-    def _normalize_name(self, name: str) -> str:
-        """Basic normalization for moves, abilities, items."""
-        return name.lower().replace(" ", "").replace("-", "").replace(".", "").replace("'", "")
-
     def get_move(self, name: str) -> dict | None:
         """
         Get move data by name.
@@ -133,8 +428,8 @@ class PokemonDataLoader:
         Returns:
             Move data dict or None if not found
         """
-        self.load_all()
-        key = self._normalize_name(name)
+        self._ensure_moves()
+        key = _normalize_name(name)
         return self.moves.get(key)
 
     def get_ability(self, name: str) -> dict | None:
@@ -147,10 +442,29 @@ class PokemonDataLoader:
         Returns:
             Ability data dict or None if not found
         """
-        self.load_all()
-        key = self._normalize_name(name)
+        self._ensure_abilities()
+        key = _normalize_name(name)
         return self.abilities.get(key)
 
+    def get_abilities_bulk(self, names: Iterable[str]) -> dict[str, dict]:
+        """
+        Get data for several abilities at once.
+
+        Args:
+            names: Ability names (case-insensitive)
+
+        Returns:
+            Dict mapping each found name, as given, to its ability data
+        """
+        self._ensure_abilities()
+        abilities = self.abilities
+        found = {}
+        for name in names:
+            data = abilities.get(_normalize_name(name))
+            if data is not None:
+                found[name] = data
+        return found
+
     def get_item(self, name: str) -> dict | None:
         """
         Get item data by name.
@@ -161,12 +475,12 @@ class PokemonDataLoader:
         Returns:
             Item data dict or None if not found
         """
-        self.load_all()
-        key = self._normalize_name(name)
+        self._ensure_items()
+        key = _normalize_name(name)
         return self.items.get(key)
 
     def get_type_effectiveness(
-        self, attack_type: str, defend_types: list[str]
+        self, attack_type: str, defend_types: Sequence[str]
     ) -> float:
         """
         Calculate type effectiveness multiplier.
@@ -178,54 +492,156 @@ class PokemonDataLoader:
         Returns:
             Effectiveness multiplier (0, 0.25, 0.5, 1, 2, 4)
         """
-        self.load_all()
+        return self._cached_effectiveness(attack_type, tuple(defend_types))
 
-        attack_type = attack_type.lower()
-        defend_types = [t.lower() for t in defend_types]
+    def _type_effectiveness(self, attack_type: str, defend_types: tuple[str, ...]) -> float:
+        """Uncached body of get_type_effectiveness."""
+        self._ensure_typechart()
 
+        attack_type = attack_type.lower()
+        index = self._type_index
         multiplier = 1.0
 
-        # Type chart maps defending type -> attacking type -> multiplier
+        attack = index.get(attack_type)
+        if attack is not None:
+            # Two list indexes per defending type instead of two dict lookups
+            matrix = self._eff_matrix
+            for defend_type in defend_types:
+                defend = index.get(defend_type.lower())
+                if defend is not None:
+                    multiplier *= matrix[defend][attack]
+            return multiplier
+
+        # Non-type chart keys (weather, status immunities) only live in the dicts
+        typechart = self.typechart
         for defend_type in defend_types:
-            type_data = self.typechart.get(defend_type, {})
-            eff = type_data.get(attack_type, 1.0)
-            multiplier *= eff
+            type_data = typechart.get(defend_type.lower())
+            if type_data is not None:
+                multiplier *= type_data.get(attack_type, 1.0)
 
         return multiplier
 
+    def bulk_type_effectiveness(
+        self, attack_types: list[str], defenders: list[list[str]]
+    ) -> list[float]:
+        """
+        Calculate type effectiveness for many matchups at once.
+
+        Args:
+            attack_types: Attacking types, one per matchup
+            defenders: Defending type lists, paired with attack_types by position
+
+        Returns:
+            Effectiveness multiplier for each matchup
+        """
+        self._ensure_typechart()
+        index = self._type_index
+        matrix = self._eff_matrix
+
+        results = []
+        for attack_type, defend_types in zip(attack_types, defenders, strict=True):
+            attack = index.get(attack_type.lower())
+            if attack is None:
+                # Weather and status immunities are only in the chart dicts
+                results.append(self._type_effectiveness(attack_type, tuple(defend_types)))
+                continue
+            multiplier = 1.0
+            for defend_type in defend_types:
+                defend = index.get(defend_type.lower())
+                if defend is not None:
+                    multiplier *= matrix[defend][attack]
+            results.append(multiplier)
+        return results
+
+    def _build_ability_index(self) -> dict[str, list[str]]:
+        """Map normalized ability name -> sorted names of Pokemon that can have it."""
+        if self._ability_index is None:
+            self._ensure_pokemon()
+            index: dict[str, list[str]] = {}
+            for poke_id, poke_data in self.pokemon.items():
+                name = poke_data.get("name", poke_id)
+                abilities = {_normalize_name(a) for a in poke_data.get("abilities", {}).values()}
+                for ability in abilities:
+                    index.setdefault(ability, []).append(name)
+            # Sorted once here so callers can list names without re-sorting
+            for names in index.values():
+                names.sort()
+            self._ability_index = index
+        return self._ability_index
+
     def get_pokemon_with_ability(self, ability_name: str) -> list[str]:
         """Find all Pokemon that can have a specific ability."""
-        self.load_all()
-        ability_lower = ability_name.lower()
-        result = []
-
-        for poke_id, poke_data in self.pokemon.items():
-            abilities = poke_data.get("abilities", {})
-            for ability in abilities.values():
-                if ability.lower() == ability_lower:
-                    result.append(poke_data.get("name", poke_id))
-                    break
+        return list(self._build_ability_index().get(_normalize_name(ability_name), []))
 
-        return result
+    def _ensure_move_indexes(self) -> None:
+        """Index moves by lowercase type and by descending priority."""
+        if self._indexed_moves:
+            return
+        self._ensure_moves()
+
+        by_type: dict[str, list[dict]] = {}
+        entries = list(self.moves.values())
+        for move_data in entries:
+            by_type.setdefault(move_data.get("type", "").lower(), []).append(move_data)
+
+        # Stable sort keeps dex order within each priority bracket
+        self._moves_by_priority = sorted(
+            entries, key=itemgetter("priority"), reverse=True
+        )
+        self._move_entries = entries
+        # Negated so the keys ascend and bisect can find the cut-off
+        self._priority_keys = [-m["priority"] for m in self._moves_by_priority]
+        self._moves_by_type = by_type
+        self._move_ids_by_type = {
+            move_type: tuple(m["id"] for m in moves) for move_type, moves in by_type.items()
+        }
+        self._indexed_moves = True
 
     def search_moves_by_type(self, move_type: str) -> list[dict]:
-        """Find all moves of a specific type."""
-        self.load_all()
-        type_lower = move_type.lower()
-        return [
-            {"id": k, **v}
-            for k, v in self.moves.items()
-            if v.get("type", "").lower() == type_lower
-        ]
+        """Find all moves of a specific type (shared move dicts, read-only)."""
+        self._ensure_move_indexes()
+        return list(self._moves_by_type.get(move_type.lower(), []))
+
+    def search_move_ids_by_type(self, move_type: str) -> tuple[str, ...]:
+        """Find the ids of all moves of a specific type."""
+        self._ensure_move_indexes()
+        return self._move_ids_by_type.get(move_type.lower(), ())
 
     def search_moves_by_priority(self, min_priority: int = 1) -> list[dict]:
-        """Find all priority moves."""
-        self.load_all()
-        return [
-            {"id": k, **v}
-            for k, v in self.moves.items()
-            if v.get("priority", 0) >= min_priority
-        ]
+        """Find all priority moves, highest priority first (shared move dicts, read-only)."""
+        self._ensure_move_indexes()
+        cut = bisect_right(self._priority_keys, -min_priority)
+        return self._moves_by_priority[:cut]
+
+    def _type_mask(self, types: Iterable[str]) -> int:
+        """Pack lowercase type names into a bitmask; unknown types set no bit."""
+        bits = self._type_bits
+        mask = 0
+        for type_name in types:
+            mask |= bits.get(type_name, 0)
+        return mask
+
+    def _build_stat_index(self, stat_key: str) -> _StatColumns:
+        """Return one base stat as a sorted column plus parallel filter columns."""
+        index = self._stat_index.get(stat_key)
+        if index is None:
+            self._ensure_pokemon()
+            # Stable sort keeps dex order among Pokemon with equal stats
+            rows = sorted(
+                self.pokemon.items(),
+                key=lambda kv: kv[1].get("baseStats", {}).get(stat_key, 0),
+            )
+            index = (
+                [data.get("baseStats", {}).get(stat_key, 0) for _, data in rows],
+                [poke_id for poke_id, _ in rows],
+                [data.get("tier", "").lower() for _, data in rows],
+                [
+                    self._type_mask(t.lower() for t in data.get("types", []))
+                    for _, data in rows
+                ],
+            )
+            self._stat_index[stat_key] = index
+        return index
 
     def search_pokemon_by_stat(
         self,
@@ -246,139 +662,63 @@ class PokemonDataLoader:
             tier: Optional tier filter (e.g., "OU", "UU")
 
         Returns:
-            List of matching Pokemon dicts with id and name
+            List of matching Pokemon dicts with id and name. The dicts are
+            shared with later identical searches; treat them as read-only.
         """
-        self.load_all()
-        stat = stat.lower()
-        stat_key_map = {
-            "hp": "hp", "atk": "atk", "attack": "atk",
-            "def": "def", "defense": "def",
-            "spa": "spa", "spatk": "spa", "special_attack": "spa",
-            "spd": "spd", "spdef": "spd", "special_defense": "spd",
-            "spe": "spe", "speed": "spe",
-        }
-        stat_key = stat_key_map.get(stat, stat)
-        types_lower = [t.lower() for t in types] if types else None
-
+        # Normalize arguments up front so equivalent queries share a cache entry
+        return list(self._cached_stat_search(
+            stat.lower(),
+            min_value,
+            max_value,
+            tuple(t.lower() for t in types) if types else None,
+            tier.lower() if tier else None,
+        ))
+
+    def _search_pokemon_by_stat(
+        self,
+        stat: str,
+        min_value: int,
+        max_value: int,
+        types_lower: tuple[str, ...] | None,
+        tier: str | None,
+    ) -> tuple[dict, ...]:
+        """Run a stat search on pre-normalized, hashable arguments."""
+        self._ensure_pokemon()
+        stat_key = _STAT_KEYS.get(stat, stat)
+
+        # Only walk the slice of the sorted column inside the requested range
+        values, poke_ids, tiers, type_masks = self._build_stat_index(stat_key)
+        start = bisect_left(values, min_value)
+        end = bisect_right(values, max_value)
+
+        # Unknown query types get no bit, so they match nothing
+        type_query = 0
+        if types_lower:
+            for type_name in types_lower:
+                type_query |= self._type_bits.get(type_name, 0)
+
+        pokemon = self.pokemon
         results = []
-        for poke_id, poke_data in self.pokemon.items():
-            base_stats = poke_data.get("baseStats", {})
-            stat_val = base_stats.get(stat_key, 0)
-
-            if not (min_value <= stat_val <= max_value):
+        for i in range(start, end):
+            # Filter on the parallel columns before touching the Pokemon dict
+            if types_lower and not type_masks[i] & type_query:
+                continue
+            if tier and tiers[i] != tier:
                 continue
 
-            if types_lower:
-                poke_types = [t.lower() for t in poke_data.get("types", [])]
-                if not any(t in poke_types for t in types_lower):
-                    continue
-
-            if tier:
-                poke_tier = poke_data.get("tier", "").lower()
-                if poke_tier != tier.lower():
-                    continue
-
+            poke_id = poke_ids[i]
+            poke_data = pokemon[poke_id]
             results.append({
                 "id": poke_id,
                 "name": poke_data.get("name", poke_id),
                 "types": poke_data.get("types", []),
                 "tier": poke_data.get("tier", ""),
-                stat_key: stat_val,
-                "baseStats": base_stats,
+                stat_key: values[i],
+                "baseStats": poke_data.get("baseStats", {}),
             })
 
-        results.sort(key=lambda p: p.get(stat_key, 0), reverse=(stat_key != "spe" or min_value > 50))
-        return results
-
-    # Move effect categories for search_moves_by_effect
-    MOVE_EFFECT_CATEGORIES: dict[str, dict[str, Any]] = {
-        "spread": {
-            "desc": "Moves that hit multiple targets",
-            "flags": [],
-            "targets": ["allAdjacentFoes", "allAdjacent", "all"],
-        },
-        "priority": {
-            "desc": "Moves with increased priority",
-            "flags": [],
-            "targets": [],
-        },
-        "recovery": {
-            "desc": "Moves that restore HP",
-            "keywords": ["heal", "recover", "restore", "drain"],
-            "moves": [
-                "recover", "softboiled", "roost", "moonlight", "morningsun",
-                "synthesis", "shoreup", "slackoff", "milkdrink", "wish",
-                "healorder", "junglehealing", "lunarblessing", "lifedew",
-                "strengthsap",
-            ],
-        },
-        "setup": {
-            "desc": "Stat-boosting moves",
-            "moves": [
-                "swordsdance", "nastyplot", "calmmind", "dragondance",
-                "bulkup", "irondefense", "amnesia", "agility", "rockpolish",
-                "shellsmash", "quiverdance", "coil", "curse",
-                "tailglow", "geomancy", "shiftgear", "tidyup",
-                "victorydance", "clangoroussoul", "noretreat",
-                "bellydrum", "filletaway",
-            ],
-        },
-        "hazard": {
-            "desc": "Entry hazard moves",
-            "moves": [
-                "stealthrock", "spikes", "toxicspikes", "stickyweb",
-                "caltrop",
-            ],
-        },
-        "hazard_removal": {
-            "desc": "Moves that remove entry hazards",
-            "moves": ["rapidspin", "defog", "courtchange", "tidyup", "mortalspin"],
-        },
-        "weather": {
-            "desc": "Weather-setting moves",
-            "moves": [
-                "sunnyday", "raindance", "sandstorm", "snowscape", "hail",
-            ],
-        },
-        "terrain": {
-            "desc": "Terrain-setting moves",
-            "moves": [
-                "electricterrain", "grassyterrain", "mistyterrain",
-                "psychicterrain",
-            ],
-        },
-        "screen": {
-            "desc": "Damage-reducing screens",
-            "moves": ["reflect", "lightscreen", "auroraveil"],
-        },
-        "pivot": {
-            "desc": "Moves that switch the user out",
-            "moves": [
-                "uturn", "voltswitch", "flipturn", "partingshot",
-                "batonpass", "teleport", "shedtail", "chillyreception",
-            ],
-        },
-        "speed_control": {
-            "desc": "Moves that affect speed order",
-            "moves": [
-                "tailwind", "trickroom", "icywind", "electroweb",
-                "stringshot", "stickyweb", "thunderwave", "glare",
-                "bulldoze", "rockslide", "scaryface",
-            ],
-        },
-        "redirection": {
-            "desc": "Moves that redirect attacks in doubles",
-            "moves": ["followme", "ragepowder", "spotlight", "allyswitch"],
-        },
-        "protect": {
-            "desc": "Protection moves",
-            "moves": [
-                "protect", "detect", "spikyshield", "kingsshield",
-                "banefulbunker", "obstruct", "silktrap", "burningbulwark",
-                "wideguard", "quickguard", "matblock",
-            ],
-        },
-    }
+        results.sort(key=itemgetter(stat_key), reverse=(stat_key != "spe" or min_value > 50))
+        return tuple(results)
 
     def search_moves_by_effect(
         self, effect: str, move_type: str | None = None
@@ -393,50 +733,58 @@ class PokemonDataLoader:
             move_type: Optional type filter (e.g., "fire")
 
         Returns:
-            List of matching move dicts
+            List of matching move dicts, shared with the loader; treat them
+            as read-only.
         """
-        self.load_all()
-        effect = effect.lower().replace(" ", "_")
-        category = self.MOVE_EFFECT_CATEGORIES.get(effect)
+        return list(self._cached_effect_search(
+            effect.lower().replace(" ", "_"),
+            move_type.lower() if move_type else None,
+        ))
+
+    def search_move_ids_by_effect(
+        self, effect: str, move_type: str | None = None
+    ) -> tuple[str, ...]:
+        """Like search_moves_by_effect, but return only the move ids."""
+        moves = self._cached_effect_search(
+            effect.lower().replace(" ", "_"),
+            move_type.lower() if move_type else None,
+        )
+        return tuple(m["id"] for m in moves)
+
+    def _search_moves_by_effect(
+        self, effect: str, move_type: str | None
+    ) -> tuple[dict, ...]:
+        """Run an effect search on pre-normalized arguments."""
+        self._ensure_move_indexes()
+        category = _MOVE_EFFECT_CATEGORIES.get(effect)
         if category is None:
-            return []
+            return ()
 
-        type_lower = move_type.lower() if move_type else None
-        results = []
+        # A type filter narrows the scan to that type's bucket
+        if move_type:
+            candidates = self._moves_by_type.get(move_type, [])
+        else:
+            candidates = self._move_entries
 
         # For priority, use the priority field
         if effect == "priority":
-            for move_id, move_data in self.moves.items():
-                if move_data.get("priority", 0) > 0:
-                    if type_lower and move_data.get("type", "").lower() != type_lower:
-                        continue
-                    results.append({"id": move_id, **move_data})
-            results.sort(key=lambda m: m.get("priority", 0), reverse=True)
-            return results
+            results = [m for m in candidates if m["priority"] > 0]
+            results.sort(key=itemgetter("priority"), reverse=True)
+            return tuple(results)
 
         # For spread moves, check target field
-        if "targets" in category and category["targets"]:
-            for move_id, move_data in self.moves.items():
-                target = move_data.get("target", "")
-                if target in category["targets"]:
-                    if type_lower and move_data.get("type", "").lower() != type_lower:
-                        continue
-                    results.append({"id": move_id, **move_data})
-            results.sort(key=lambda m: m.get("basePower", 0), reverse=True)
-            return results
+        targets = category.get("targets")
+        if targets:
+            results = [m for m in candidates if m.get("target", "") in targets]
+            results.sort(key=itemgetter("basePower"), reverse=True)
+            return tuple(results)
 
         # For named move lists
-        move_ids = set(category.get("moves", []))
+        move_ids = category.get("moves")
         if not move_ids:
-            return []
+            return ()
 
-        for move_id, move_data in self.moves.items():
-            if move_id in move_ids:
-                if type_lower and move_data.get("type", "").lower() != type_lower:
-                    continue
-                results.append({"id": move_id, **move_data})
-
-        return results
+        return tuple(m for m in candidates if m["id"] in move_ids)
 
 
 # Global instance
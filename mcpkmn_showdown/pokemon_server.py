@@ -11,6 +11,7 @@ Tools:
 - get_ability: Look up ability descriptions
 - get_item: Look up held item effects
 - get_type_effectiveness: Calculate type matchup multipliers
+- get_type_matchups: One attacking type against many defenders at once
 - search_priority_moves: Find all priority moves
 - search_pokemon_by_ability: Find Pokemon with a specific ability
 - list_dangerous_abilities: List battle-critical abilities
@@ -23,6 +24,15 @@ Tools:
 - get_format_info: Format rules and meta characteristics
 """
 
+import asyncio
+import heapq
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 from mcp.server import Server
@@ -30,16 +40,76 @@ from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
 try:
-    from mcpkmn_showdown.data_loader import get_loader
-    from mcpkmn_showdown.smogon_stats import get_stats_loader
+    from mcpkmn_showdown.data_loader import PokemonDataLoader, get_loader
+    from mcpkmn_showdown.smogon_stats import (
+        MISS_MAX_AGE_HOURS,
+        PREFETCH_FORMATS_ENV,
+        SmogonStatsLoader,
+        _get_latest_month,
+        get_stats_loader,
+    )
 except ImportError:
-    from .data_loader import get_loader
-    from .smogon_stats import get_stats_loader
+    from .data_loader import PokemonDataLoader, get_loader
+    from .smogon_stats import (
+        MISS_MAX_AGE_HOURS,
+        PREFETCH_FORMATS_ENV,
+        SmogonStatsLoader,
+        _get_latest_month,
+        get_stats_loader,
+    )
 
 
 # Create server instance
 server = Server("pokemon-data")
 
+# Sort key for (name, percentage) pairs from usage dicts
+_BY_VALUE = itemgetter(1)
+
+_NL = "\n"
+
+# Pokedex ability slot -> label ("S" marks special-event abilities like Battle Bond)
+_SLOT_LABEL = {"0": "Slot 1", "1": "Slot 2", "2": "Slot 3", "3": "Slot 4", "H": "Hidden", "S": "Special"}
+
+# Response scaffolding, filled in with str.format_map by the formatters below
+_POKEMON_TEMPLATE = """## {name}
+
+**Types:** {types}
+**Tier:** {tier}
+**Weight:** {weight}kg
+
+### Base Stats
+- HP: {hp}
+- Attack: {atk}
+- Defense: {def}
+- Sp. Attack: {spa}
+- Sp. Defense: {spd}
+- Speed: {spe}
+- **Total:** {total}
+
+### Abilities
+{abilities}
+"""
+
+_MOVE_TEMPLATE = """## {name}
+
+**Type:** {type}
+**Category:** {category}
+**Power:** {power}
+**Accuracy:** {accuracy}
+**PP:** {pp}{extras}
+
+### Description
+{desc}
+"""
+
+# Shared by abilities and items
+_EFFECT_TEMPLATE = """## {name}
+
+### Effect
+{desc}
+"""
+_SUMMARY_TEMPLATE = "\n### Summary\n{short_desc}\n"
+
 
 def format_pokemon_response(pokemon: dict) -> str:
     """Format Pokemon data into a readable response."""
@@ -51,49 +121,104 @@ def format_pokemon_response(pokemon: dict) -> str:
     tier = pokemon.get("tier", "Unknown")
 
     # Get ability descriptions
-    loader = get_loader()
+    ability_map = get_loader().get_abilities_bulk(abilities.values())
     ability_details = []
     for key, ability_name in abilities.items():
-        ability_data = loader.get_ability(ability_name)
+        slot = _SLOT_LABEL.get(key, key)
+        ability_data = ability_map.get(ability_name)
         if ability_data:
             desc = ability_data.get("shortDesc") or ability_data.get("desc", "")
-            slot = "Hidden" if key == "H" else f"Slot {int(key) + 1}"
             ability_details.append(f"  - {ability_name} ({slot}): {desc}")
         else:
-            slot = "Hidden" if key == "H" else f"Slot {int(key) + 1}"
             ability_details.append(f"  - {ability_name} ({slot})")
 
-    response = f"""## {name}
+    # Precomputed by the loader; fall back for dicts built elsewhere
+    total = pokemon.get("_bst")
+    if total is None:
+        total = sum(stats.values())
+    stat = stats.get
+    return _POKEMON_TEMPLATE.format_map({
+        "name": name,
+        "types": ", ".join(types),
+        "tier": tier,
+        "weight": weight,
+        "hp": stat("hp", "?"),
+        "atk": stat("atk", "?"),
+        "def": stat("def", "?"),
+        "spa": stat("spa", "?"),
+        "spd": stat("spd", "?"),
+        "spe": stat("spe", "?"),
+        "total": total,
+        "abilities": _NL.join(ability_details),
+    })
+
+
+def _format_boosts(boosts: dict[str, int]) -> str:
+    """Render stat changes as 'atk +1, spe -1'."""
+    return ", ".join(f"{k} {v:+d}" for k, v in boosts.items())
+
+
+def _fmt_priority(move: dict) -> str:
+    priority = move.get("priority", 0)
+    if priority > 0:
+        return f"\n**Priority:** +{priority} (moves before normal moves)"
+    if priority < 0:
+        return f"\n**Priority:** {priority} (moves after normal moves)"
+    return ""
 
-**Types:** {', '.join(types)}
-**Tier:** {tier}
-**Weight:** {weight}kg
 
-### Base Stats
-- HP: {stats.get('hp', '?')}
-- Attack: {stats.get('atk', '?')}
-- Defense: {stats.get('def', '?')}
-- Sp. Attack: {stats.get('spa', '?')}
-- Sp. Defense: {stats.get('spd', '?')}
-- Speed: {stats.get('spe', '?')}
-- **Total:** {sum(stats.values())}
+def _fmt_secondary(move: dict) -> str:
+    secondary = move.get("secondary")
+    if not secondary:
+        return ""
+    effect = []
+    if secondary.get("status"):
+        effect.append(f"{secondary['status'].upper()}")
+    if secondary.get("boosts"):
+        effect.append(f"stat change: {_format_boosts(secondary['boosts'])}")
+    if secondary.get("volatileStatus"):
+        effect.append(secondary["volatileStatus"])
+    if not effect:
+        return ""
+    chance = secondary.get("chance", 100)
+    return f"\n**Secondary Effect ({chance}% chance):** {', '.join(effect)}"
+
+
+def _fmt_self(move: dict) -> str:
+    self_effect = move.get("self", {})
+    if self_effect.get("boosts"):
+        return f"\n**Self Effect:** {_format_boosts(self_effect['boosts'])}"
+    return ""
+
+
+def _fmt_drain(move: dict) -> str:
+    drain = move.get("drain")
+    if drain:
+        return f"\n**Drain:** Heals {int(drain[0] / drain[1] * 100)}% of damage dealt"
+    return ""
 
-### Abilities
-{chr(10).join(ability_details)}
-"""
-    return response
+
+def _fmt_recoil(move: dict) -> str:
+    recoil = move.get("recoil")
+    if recoil:
+        return f"\n**Recoil:** Takes {int(recoil[0] / recoil[1] * 100)}% of damage dealt"
+    return ""
+
+
+# Optional lines of a move response, in display order
+_MOVE_SECTIONS = (_fmt_priority, _fmt_secondary, _fmt_self, _fmt_drain, _fmt_recoil)
 
 
 def format_move_response(move: dict) -> str:
     """Format move data into a readable response."""
-    name = move.get("name", "Unknown")
-    move_type = move.get("type", "Normal")
-    category = move.get("category", "Status")
-    power = move.get("basePower", 0)
-    accuracy = move.get("accuracy", 100)
-    pp = move.get("pp", 0)
-    priority = move.get("priority", 0)
-    desc = move.get("desc", move.get("shortDesc", "No description."))
+    get = move.get
+    name = get("name", "Unknown")
+    move_type = get("type", "Normal")
+    category = get("category", "Status")
+    power = get("basePower", 0)
+    accuracy = get("accuracy", 100)
+    pp = get("pp", 0)
+    desc = get("desc", get("shortDesc", "No description."))
 
     # Handle accuracy = true (never misses)
     if accuracy is True:
@@ -101,56 +226,16 @@ def format_move_response(move: dict) -> str:
     else:
         accuracy_str = f"{accuracy}%"
 
-    priority_str = ""
-    if priority > 0:
-        priority_str = f"\n**Priority:** +{priority} (moves before normal moves)"
-    elif priority < 0:
-        priority_str = f"\n**Priority:** {priority} (moves after normal moves)"
-
-    # Secondary effects
-    secondary = move.get("secondary")
-    secondary_str = ""
-    if secondary:
-        chance = secondary.get("chance", 100)
-        effect = []
-        if secondary.get("status"):
-            effect.append(f"{secondary['status'].upper()}")
-        if secondary.get("boosts"):
-            boosts = [f"{k} {v:+d}" for k, v in secondary["boosts"].items()]
-            effect.append(f"stat change: {', '.join(boosts)}")
-        if secondary.get("volatileStatus"):
-            effect.append(secondary["volatileStatus"])
-        if effect:
-            secondary_str = f"\n**Secondary Effect ({chance}% chance):** {', '.join(effect)}"
-
-    # Self effects
-    self_effect = move.get("self", {})
-    self_str = ""
-    if self_effect.get("boosts"):
-        boosts = [f"{k} {v:+d}" for k, v in self_effect["boosts"].items()]
-        self_str = f"\n**Self Effect:** {', '.join(boosts)}"
-
-    # Drain/recoil
-    drain_str = ""
-    if move.get("drain"):
-        drain_pct = int(move["drain"][0] / move["drain"][1] * 100)
-        drain_str = f"\n**Drain:** Heals {drain_pct}% of damage dealt"
-    if move.get("recoil"):
-        recoil_pct = int(move["recoil"][0] / move["recoil"][1] * 100)
-        drain_str = f"\n**Recoil:** Takes {recoil_pct}% of damage dealt"
-
-    response = f"""## {name}
-
-**Type:** {move_type}
-**Category:** {category}
-**Power:** {power if power > 0 else '-'}
-**Accuracy:** {accuracy_str}
-**PP:** {pp}{priority_str}{secondary_str}{self_str}{drain_str}
-
-### Description
-{desc}
-"""
-    return response
+    return _MOVE_TEMPLATE.format_map({
+        "name": name,
+        "type": move_type,
+        "category": category,
+        "power": power if power > 0 else "-",
+        "accuracy": accuracy_str,
+        "pp": pp,
+        "extras": "".join(fmt(move) for fmt in _MOVE_SECTIONS),
+        "desc": desc,
+    })
 
 
 def format_ability_response(ability: dict) -> str:
@@ -159,13 +244,9 @@ def format_ability_response(ability: dict) -> str:
     desc = ability.get("desc", ability.get("shortDesc", "No description."))
     short_desc = ability.get("shortDesc", "")
 
-    response = f"""## {name}
-
-### Effect
-{desc}
-"""
+    response = _EFFECT_TEMPLATE.format(name=name, desc=desc)
     if short_desc and short_desc != desc:
-        response += f"\n### Summary\n{short_desc}\n"
+        response += _SUMMARY_TEMPLATE.format(short_desc=short_desc)
 
     return response
 
@@ -176,718 +257,1009 @@ def format_item_response(item: dict) -> str:
     desc = item.get("desc", item.get("shortDesc", "No description."))
     short_desc = item.get("shortDesc", "")
 
-    response = f"""## {name}
-
-### Effect
-{desc}
-"""
+    response = _EFFECT_TEMPLATE.format(name=name, desc=desc)
     if short_desc and short_desc != desc:
-        response += f"\n### Summary\n{short_desc}\n"
+        response += _SUMMARY_TEMPLATE.format(short_desc=short_desc)
 
     return response
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Pokemon data tools."""
-    return [
-        Tool(
-            name="get_pokemon",
-            description="Look up a Pokemon by name. Returns base stats, types, abilities with descriptions, weight, and competitive tier.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Pokemon name (e.g., 'pikachu', 'slaking', 'charizard')"
-                    }
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="get_move",
-            description="Look up a move by name. Returns power, accuracy, type, category, priority, effects, and full description.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Move name (e.g., 'thunderbolt', 'earthquake', 'swords-dance')"
-                    }
+# Rendered responses for the static game data. Keyed on the loader as well
+# as the query so a different loader never sees another one's text.
+@lru_cache(maxsize=4096)
+def _pokemon_response(loader: PokemonDataLoader, name: str) -> str | None:
+    pokemon = loader.get_pokemon(name)
+    return format_pokemon_response(pokemon) if pokemon else None
+
+
+@lru_cache(maxsize=4096)
+def _move_response(loader: PokemonDataLoader, name: str) -> str | None:
+    move = loader.get_move(name)
+    return format_move_response(move) if move else None
+
+
+@lru_cache(maxsize=4096)
+def _ability_response(loader: PokemonDataLoader, name: str) -> str | None:
+    ability = loader.get_ability(name)
+    return format_ability_response(ability) if ability else None
+
+
+@lru_cache(maxsize=4096)
+def _item_response(loader: PokemonDataLoader, name: str) -> str | None:
+    item = loader.get_item(name)
+    return format_item_response(item) if item else None
+
+
+def _describe_multiplier(multiplier: float) -> str:
+    """Describe a type effectiveness multiplier in words."""
+    if multiplier == 0:
+        return "No effect (immune)"
+    elif multiplier == 0.25:
+        return "Not very effective (0.25x)"
+    elif multiplier == 0.5:
+        return "Not very effective (0.5x)"
+    elif multiplier == 1:
+        return "Normal effectiveness (1x)"
+    elif multiplier == 2:
+        return "Super effective (2x)"
+    elif multiplier == 4:
+        return "Super effective (4x)"
+    return f"{multiplier}x"
+
+
+@lru_cache(maxsize=4096)
+def _type_effectiveness_response(
+    loader: PokemonDataLoader, attack_type: str, defend_types: tuple[str, ...]
+) -> str:
+    multiplier = loader.get_type_effectiveness(attack_type, defend_types)
+    desc = _describe_multiplier(multiplier)
+
+    return f"""## Type Effectiveness
+
+**{attack_type.capitalize()}** vs **{'/'.join(t.capitalize() for t in defend_types)}**
+
+**Multiplier:** {multiplier}x
+**Result:** {desc}
+"""
+
+
+# Tool definitions are static, so build them once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_pokemon",
+        description="Look up a Pokemon by name. Returns base stats, types, abilities with descriptions, weight, and competitive tier.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Pokemon name (e.g., 'pikachu', 'slaking', 'charizard')"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="get_move",
+        description="Look up a move by name. Returns power, accuracy, type, category, priority, effects, and full description.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Move name (e.g., 'thunderbolt', 'earthquake', 'swords-dance')"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="get_ability",
+        description="Look up an ability by name. Returns full description of what the ability does in battle.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Ability name (e.g., 'truant', 'intimidate', 'levitate')"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="get_item",
+        description="Look up a held item by name. Returns full description of what the item does in battle.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Item name (e.g., 'choice-scarf', 'leftovers', 'life-orb')"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="get_type_effectiveness",
+        description="Calculate type effectiveness multiplier for an attack against a Pokemon's types.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "attack_type": {
+                    "type": "string",
+                    "description": "The attacking move's type (e.g., 'electric', 'fire')"
                 },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="get_ability",
-            description="Look up an ability by name. Returns full description of what the ability does in battle.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Ability name (e.g., 'truant', 'intimidate', 'levitate')"
-                    }
+                "defend_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of the defending Pokemon's types (e.g., ['water', 'flying'])"
+                }
+            },
+            "required": ["attack_type", "defend_types"]
+        }
+    ),
+    Tool(
+        name="get_type_matchups",
+        description="Calculate one attacking type's multiplier against several defending Pokemon at once. Useful for checking which team members wall or are weak to an attack.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "attack_type": {
+                    "type": "string",
+                    "description": "The attacking move's type (e.g., 'ground')"
                 },
-                "required": ["name"]
+                "defenders": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "string"}},
+                    "description": "Each defender's types (e.g., [['water', 'flying'], ['steel'], ['fire', 'ground']])"
+                }
+            },
+            "required": ["attack_type", "defenders"]
+        }
+    ),
+    Tool(
+        name="search_priority_moves",
+        description="Find all moves with priority (moves that go before normal moves). Useful for finding options when you need to outspeed an opponent.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "min_priority": {
+                    "type": "integer",
+                    "description": "Minimum priority value (default 1)",
+                    "default": 1
+                }
             }
-        ),
-        Tool(
-            name="get_item",
-            description="Look up a held item by name. Returns full description of what the item does in battle.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Item name (e.g., 'choice-scarf', 'leftovers', 'life-orb')"
-                    }
-                },
-                "required": ["name"]
+        }
+    ),
+    Tool(
+        name="search_pokemon_by_ability",
+        description="Find all Pokemon that can have a specific ability.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ability": {
+                    "type": "string",
+                    "description": "Ability name to search for"
+                }
+            },
+            "required": ["ability"]
+        }
+    ),
+    Tool(
+        name="list_dangerous_abilities",
+        description="List abilities that can significantly affect battle outcomes (immunities, damage reduction, status reflection, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Category of abilities: 'immunity' (type immunities), 'defense' (damage reduction), 'reflect' (status reflection), 'offense' (damage boosts), 'priority' (move order), 'all' (default)",
+                    "default": "all"
+                }
             }
-        ),
-        Tool(
-            name="get_type_effectiveness",
-            description="Calculate type effectiveness multiplier for an attack against a Pokemon's types.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "attack_type": {
-                        "type": "string",
-                        "description": "The attacking move's type (e.g., 'electric', 'fire')"
-                    },
-                    "defend_types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of the defending Pokemon's types (e.g., ['water', 'flying'])"
-                    }
+        }
+    ),
+    Tool(
+        name="get_smogon_usage",
+        description="Get the top Pokemon by usage in a competitive format. Shows which Pokemon are most popular and viable.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "description": "Format identifier (e.g., 'gen9ou', 'gen9vgc2025', 'gen9uu', 'gen9ubers', 'gen9doublesou')"
                 },
-                "required": ["attack_type", "defend_types"]
-            }
-        ),
-        Tool(
-            name="search_priority_moves",
-            description="Find all moves with priority (moves that go before normal moves). Useful for finding options when you need to outspeed an opponent.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "min_priority": {
-                        "type": "integer",
-                        "description": "Minimum priority value (default 1)",
-                        "default": 1
-                    }
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of top Pokemon to return (default 20)",
+                    "default": 20
                 }
-            }
-        ),
-        Tool(
-            name="search_pokemon_by_ability",
-            description="Find all Pokemon that can have a specific ability.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ability": {
-                        "type": "string",
-                        "description": "Ability name to search for"
-                    }
+            },
+            "required": ["format"]
+        }
+    ),
+    Tool(
+        name="get_smogon_sets",
+        description="Get competitive sets for a Pokemon in a format: common moves, items, abilities, EV spreads, Tera types, and teammates.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pokemon": {
+                    "type": "string",
+                    "description": "Pokemon name (e.g., 'Great Tusk', 'Dragapult')"
                 },
-                "required": ["ability"]
-            }
-        ),
-        Tool(
-            name="list_dangerous_abilities",
-            description="List abilities that can significantly affect battle outcomes (immunities, damage reduction, status reflection, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Category of abilities: 'immunity' (type immunities), 'defense' (damage reduction), 'reflect' (status reflection), 'offense' (damage boosts), 'priority' (move order), 'all' (default)",
-                        "default": "all"
-                    }
+                "format": {
+                    "type": "string",
+                    "description": "Format identifier (e.g., 'gen9ou')"
                 }
-            }
-        ),
-        Tool(
-            name="get_smogon_usage",
-            description="Get the top Pokemon by usage in a competitive format. Shows which Pokemon are most popular and viable.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "format": {
-                        "type": "string",
-                        "description": "Format identifier (e.g., 'gen9ou', 'gen9vgc2025', 'gen9uu', 'gen9ubers', 'gen9doublesou')"
-                    },
-                    "top_n": {
-                        "type": "integer",
-                        "description": "Number of top Pokemon to return (default 20)",
-                        "default": 20
-                    }
+            },
+            "required": ["pokemon", "format"]
+        }
+    ),
+    Tool(
+        name="get_pokemon_counters",
+        description="Get checks and counters for a Pokemon in a format. Shows what beats it, with KO and switch-out rates.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pokemon": {
+                    "type": "string",
+                    "description": "Pokemon name to find counters for"
                 },
-                "required": ["format"]
-            }
-        ),
-        Tool(
-            name="get_smogon_sets",
-            description="Get competitive sets for a Pokemon in a format: common moves, items, abilities, EV spreads, Tera types, and teammates.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pokemon": {
-                        "type": "string",
-                        "description": "Pokemon name (e.g., 'Great Tusk', 'Dragapult')"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Format identifier (e.g., 'gen9ou')"
-                    }
+                "format": {
+                    "type": "string",
+                    "description": "Format identifier (e.g., 'gen9ou')"
+                }
+            },
+            "required": ["pokemon", "format"]
+        }
+    ),
+    Tool(
+        name="get_pokemon_teammates",
+        description="Get the best teammates for a Pokemon based on competitive usage data.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pokemon": {
+                    "type": "string",
+                    "description": "Pokemon name to find teammates for"
                 },
-                "required": ["pokemon", "format"]
-            }
-        ),
-        Tool(
-            name="get_pokemon_counters",
-            description="Get checks and counters for a Pokemon in a format. Shows what beats it, with KO and switch-out rates.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pokemon": {
-                        "type": "string",
-                        "description": "Pokemon name to find counters for"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Format identifier (e.g., 'gen9ou')"
-                    }
+                "format": {
+                    "type": "string",
+                    "description": "Format identifier (e.g., 'gen9ou')"
+                }
+            },
+            "required": ["pokemon", "format"]
+        }
+    ),
+    Tool(
+        name="search_pokemon_by_stat",
+        description="Find Pokemon filtered by base stat ranges. Useful for finding slow Pokemon for Trick Room, fast sweepers, bulky walls, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "stat": {
+                    "type": "string",
+                    "description": "Stat to filter by: 'hp', 'atk', 'def', 'spa', 'spd', 'spe'"
                 },
-                "required": ["pokemon", "format"]
-            }
-        ),
-        Tool(
-            name="get_pokemon_teammates",
-            description="Get the best teammates for a Pokemon based on competitive usage data.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pokemon": {
-                        "type": "string",
-                        "description": "Pokemon name to find teammates for"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Format identifier (e.g., 'gen9ou')"
-                    }
+                "min_value": {
+                    "type": "integer",
+                    "description": "Minimum base stat value (default 0)",
+                    "default": 0
                 },
-                "required": ["pokemon", "format"]
-            }
-        ),
-        Tool(
-            name="search_pokemon_by_stat",
-            description="Find Pokemon filtered by base stat ranges. Useful for finding slow Pokemon for Trick Room, fast sweepers, bulky walls, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stat": {
-                        "type": "string",
-                        "description": "Stat to filter by: 'hp', 'atk', 'def', 'spa', 'spd', 'spe'"
-                    },
-                    "min_value": {
-                        "type": "integer",
-                        "description": "Minimum base stat value (default 0)",
-                        "default": 0
-                    },
-                    "max_value": {
-                        "type": "integer",
-                        "description": "Maximum base stat value (default 999)",
-                        "default": 999
-                    },
-                    "types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional type filter (Pokemon must have at least one of these types)"
-                    },
-                    "tier": {
-                        "type": "string",
-                        "description": "Optional tier filter (e.g., 'OU', 'UU', 'Uber')"
-                    }
+                "max_value": {
+                    "type": "integer",
+                    "description": "Maximum base stat value (default 999)",
+                    "default": 999
                 },
-                "required": ["stat"]
-            }
-        ),
-        Tool(
-            name="search_moves_by_effect",
-            description="Find moves by strategic effect category: spread, priority, recovery, setup, hazard, hazard_removal, weather, terrain, screen, pivot, speed_control, redirection, protect.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "effect": {
-                        "type": "string",
-                        "description": "Effect category: 'spread' (multi-target), 'priority', 'recovery', 'setup' (stat boost), 'hazard', 'hazard_removal', 'weather', 'terrain', 'screen', 'pivot' (switch moves), 'speed_control', 'redirection', 'protect'"
-                    },
-                    "move_type": {
-                        "type": "string",
-                        "description": "Optional type filter (e.g., 'fire', 'ground')"
-                    }
+                "types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional type filter (Pokemon must have at least one of these types)"
                 },
-                "required": ["effect"]
-            }
-        ),
-        Tool(
-            name="get_format_info",
-            description="Get information about a competitive format: rules, common bans, and meta characteristics.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "format": {
-                        "type": "string",
-                        "description": "Format name (e.g., 'gen9ou', 'gen9vgc2025', 'gen9uu', 'gen9ubers', 'gen9doublesou')"
-                    }
+                "tier": {
+                    "type": "string",
+                    "description": "Optional tier filter (e.g., 'OU', 'UU', 'Uber')"
+                }
+            },
+            "required": ["stat"]
+        }
+    ),
+    Tool(
+        name="search_moves_by_effect",
+        description="Find moves by strategic effect category: spread, priority, recovery, setup, hazard, hazard_removal, weather, terrain, screen, pivot, speed_control, redirection, protect.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "effect": {
+                    "type": "string",
+                    "description": "Effect category: 'spread' (multi-target), 'priority', 'recovery', 'setup' (stat boost), 'hazard', 'hazard_removal', 'weather', 'terrain', 'screen', 'pivot' (switch moves), 'speed_control', 'redirection', 'protect'"
                 },
-                "required": ["format"]
-            }
-        ),
-    ]
+                "move_type": {
+                    "type": "string",
+                    "description": "Optional type filter (e.g., 'fire', 'ground')"
+                }
+            },
+            "required": ["effect"]
+        }
+    ),
+    Tool(
+        name="get_format_info",
+        description="Get information about a competitive format: rules, common bans, and meta characteristics.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "description": "Format name (e.g., 'gen9ou', 'gen9vgc2025', 'gen9uu', 'gen9ubers', 'gen9doublesou')"
+                }
+            },
+            "required": ["format"]
+        }
+    ),
+]
+
+
+# Abilities that can swing a battle, grouped for list_dangerous_abilities
+DANGEROUS_ABILITIES: dict[str, dict[str, str]] = {
+    "immunity": {
+        "Levitate": "Immune to Ground moves",
+        "Flash Fire": "Immune to Fire moves, boosts own Fire attacks",
+        "Volt Absorb": "Immune to Electric, heals instead",
+        "Water Absorb": "Immune to Water, heals instead",
+        "Dry Skin": "Immune to Water (heals), weak to Fire",
+        "Lightning Rod": "Immune to Electric, boosts Sp.Atk",
+        "Motor Drive": "Immune to Electric, boosts Speed",
+        "Storm Drain": "Immune to Water, boosts Sp.Atk",
+        "Sap Sipper": "Immune to Grass, boosts Attack",
+        "Earth Eater": "Immune to Ground, heals instead",
+        "Wonder Guard": "Only super effective moves deal damage!",
+    },
+    "defense": {
+        "Fur Coat": "Doubles Defense (halves physical damage)",
+        "Ice Scales": "Halves Special damage",
+        "Fluffy": "Halves contact damage (but 2x Fire damage)",
+        "Multiscale": "Halves damage at full HP",
+        "Shadow Shield": "Halves damage at full HP",
+        "Sturdy": "Survives any hit at full HP with 1 HP",
+        "Filter": "Reduces super effective damage by 25%",
+        "Solid Rock": "Reduces super effective damage by 25%",
+        "Prism Armor": "Reduces super effective damage by 25%",
+        "Thick Fat": "Halves Fire and Ice damage",
+        "Heatproof": "Halves Fire damage",
+        "Water Bubble": "Halves Fire damage, doubles Water attacks",
+        "Unaware": "Ignores opponent's stat boosts",
+        "Marvel Scale": "1.5x Defense when statused",
+    },
+    "reflect": {
+        "Magic Bounce": "Reflects status moves (Stealth Rock, Thunder Wave, etc.)",
+    },
+    "offense": {
+        "Huge Power": "Doubles Attack stat!",
+        "Pure Power": "Doubles Attack stat!",
+        "Adaptability": "STAB becomes 2x instead of 1.5x",
+        "Technician": "1.5x boost to moves with 60 BP or less",
+        "Tinted Lens": "Doubles 'not very effective' damage",
+        "Protean": "Changes type to match used move (always STAB)",
+        "Libero": "Changes type to match used move (always STAB)",
+    },
+    "priority": {
+        "Prankster": "+1 priority to status moves",
+        "Gale Wings": "+1 priority to Flying moves at full HP",
+    },
+    "contact": {
+        "Rough Skin": "1/8 damage to attacker on contact",
+        "Iron Barbs": "1/8 damage to attacker on contact",
+        "Flame Body": "30% chance to burn on contact",
+        "Static": "30% chance to paralyze on contact",
+        "Poison Point": "30% chance to poison on contact",
+    }
+}
+
+
+def _render_dangerous_abilities(categories: tuple[str, ...]) -> str:
+    """Render the markdown listing for the given DANGEROUS_ABILITIES categories."""
+    lines = ["## Dangerous Abilities\n"]
+    for cat in categories:
+        lines.append(f"### {cat.title()}\n")
+        for ability_name, desc in DANGEROUS_ABILITIES[cat].items():
+            lines.append(f"- **{ability_name}**: {desc}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+_DANGEROUS_CATEGORIES: tuple[str, ...] = tuple(DANGEROUS_ABILITIES)
+_DANGEROUS_CATEGORY_HINT = "Use {}, or 'all'.".format(
+    ", ".join(f"'{cat}'" for cat in _DANGEROUS_CATEGORIES)
+)
+
+# The table is static, so every valid response is rendered once at import
+_DANGEROUS_RESPONSES: dict[str, TextContent] = {
+    cat: TextContent(type="text", text=_render_dangerous_abilities((cat,)))
+    for cat in _DANGEROUS_CATEGORIES
+}
+_DANGEROUS_RESPONSES["all"] = TextContent(
+    type="text", text=_render_dangerous_abilities(_DANGEROUS_CATEGORIES)
+)
+
+
+# Competitive format summaries for get_format_info
+FORMAT_INFO: dict[str, dict[str, Any]] = {
+    "gen9ou": {
+        "name": "Generation 9 OverUsed (OU)",
+        "game": "Scarlet & Violet",
+        "type": "Singles (6v6, bring 6 pick 6)",
+        "level": 100,
+        "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause", "OHKO Clause", "Moody Clause"],
+        "key_bans": ["Uber-tier Pokemon (Koraidon, Miraidon, etc.)", "Arena Trap", "Shadow Tag", "Baton Pass"],
+        "meta_notes": "The standard competitive singles format. Terastallization available. Heavy emphasis on hazard control, pivoting, and offensive pressure.",
+    },
+    "gen9uu": {
+        "name": "Generation 9 UnderUsed (UU)",
+        "game": "Scarlet & Violet",
+        "type": "Singles (6v6)",
+        "level": 100,
+        "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause", "OHKO Clause"],
+        "key_bans": ["OU and above Pokemon by usage", "Arena Trap", "Shadow Tag"],
+        "meta_notes": "Pokemon that don't see enough play in OU. Often features creative sets and underrated threats.",
+    },
+    "gen9ubers": {
+        "name": "Generation 9 Ubers",
+        "game": "Scarlet & Violet",
+        "type": "Singles (6v6)",
+        "level": 100,
+        "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause"],
+        "key_bans": ["Mega Rayquaza (AG only)"],
+        "meta_notes": "Legendary and mythical Pokemon dominate. Extremely high power level. Koraidon, Miraidon, and Calyrex forms are staples.",
+    },
+    "gen9vgc2025": {
+        "name": "VGC 2025 (Regulation H)",
+        "game": "Scarlet & Violet",
+        "type": "Doubles (bring 6, pick 4)",
+        "level": 50,
+        "clauses": ["Species Clause", "Item Clause"],
+        "key_bans": ["Restricted legends limited (check current regulation)"],
+        "meta_notes": "Official doubles format. Level 50, bring 6 pick 4. Speed control (Tailwind, Trick Room), redirection, Fake Out, and spread moves are critical. Protect is almost mandatory.",
+    },
+    "gen9doublesou": {
+        "name": "Generation 9 Doubles OU",
+        "game": "Scarlet & Violet",
+        "type": "Doubles (6v6, bring 6 pick 6)",
+        "level": 100,
+        "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause"],
+        "key_bans": ["Uber-tier doubles Pokemon"],
+        "meta_notes": "Smogon doubles format. Level 100, bring all 6. More Pokemon variety than VGC. Spread moves, positioning, and speed control are key.",
+    },
+    "gen9randombattle": {
+        "name": "Generation 9 Random Battle",
+        "game": "Scarlet & Violet",
+        "type": "Singles (random teams)",
+        "level": "Varies (scaled by BST)",
+        "clauses": ["Random teams assigned"],
+        "key_bans": [],
+        "meta_notes": "Random teams with pre-built sets. Tests adaptability and game knowledge. Popular for casual play.",
+    },
+}
+
+
+def _render_format_info(info: dict[str, Any]) -> str:
+    """Render the markdown summary for one FORMAT_INFO entry."""
+    lines = [f"## {info['name']}\n"]
+    lines.append(f"**Game:** {info['game']}")
+    lines.append(f"**Type:** {info['type']}")
+    lines.append(f"**Level:** {info['level']}")
+    lines.append("")
+
+    if info["clauses"]:
+        lines.append("### Clauses")
+        for clause in info["clauses"]:
+            lines.append(f"- {clause}")
+        lines.append("")
 
+    if info["key_bans"]:
+        lines.append("### Key Bans")
+        for ban in info["key_bans"]:
+            lines.append(f"- {ban}")
+        lines.append("")
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls."""
-    loader = get_loader()
-
-    if name == "get_pokemon":
-        pokemon = loader.get_pokemon(arguments["name"])
-        if pokemon:
-            return [TextContent(type="text", text=format_pokemon_response(pokemon))]
-        return [TextContent(type="text", text=f"Pokemon '{arguments['name']}' not found.")]
-
-    elif name == "get_move":
-        move = loader.get_move(arguments["name"])
-        if move:
-            return [TextContent(type="text", text=format_move_response(move))]
-        return [TextContent(type="text", text=f"Move '{arguments['name']}' not found.")]
-
-    elif name == "get_ability":
-        ability = loader.get_ability(arguments["name"])
-        if ability:
-            return [TextContent(type="text", text=format_ability_response(ability))]
-        return [TextContent(type="text", text=f"Ability '{arguments['name']}' not found.")]
-
-    elif name == "get_item":
-        item = loader.get_item(arguments["name"])
-        if item:
-            return [TextContent(type="text", text=format_item_response(item))]
-        return [TextContent(type="text", text=f"Item '{arguments['name']}' not found.")]
-
-    elif name == "get_type_effectiveness":
-        attack_type = arguments["attack_type"]
-        defend_types = arguments["defend_types"]
-        multiplier = loader.get_type_effectiveness(attack_type, defend_types)
-
-        # Describe the effectiveness
-        if multiplier == 0:
-            desc = "No effect (immune)"
-        elif multiplier == 0.25:
-            desc = "Not very effective (0.25x)"
-        elif multiplier == 0.5:
-            desc = "Not very effective (0.5x)"
-        elif multiplier == 1:
-            desc = "Normal effectiveness (1x)"
-        elif multiplier == 2:
-            desc = "Super effective (2x)"
-        elif multiplier == 4:
-            desc = "Super effective (4x)"
-        else:
-            desc = f"{multiplier}x"
+    lines.append("### Meta Notes")
+    lines.append(info["meta_notes"])
 
-        response = f"""## Type Effectiveness
+    return "\n".join(lines)
 
-**{attack_type.capitalize()}** vs **{'/'.join(t.capitalize() for t in defend_types)}**
 
-**Multiplier:** {multiplier}x
-**Result:** {desc}
+_FORMAT_NAMES = ", ".join(sorted(FORMAT_INFO.keys()))
+
+# Format summaries are static too, so each one is rendered once at import
+_FORMAT_INFO_RESPONSES: dict[str, TextContent] = {
+    format_id: TextContent(type="text", text=_render_format_info(info))
+    for format_id, info in FORMAT_INFO.items()
+}
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Pokemon data tools."""
+    return list(_TOOLS)
+
+
+async def _handle_get_pokemon(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Look up a Pokemon by name."""
+    text = _pokemon_response(loader, arguments["name"])
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+    return [TextContent(type="text", text=f"Pokemon '{arguments['name']}' not found.")]
+
+
+async def _handle_get_move(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Look up a move by name."""
+    text = _move_response(loader, arguments["name"])
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+    return [TextContent(type="text", text=f"Move '{arguments['name']}' not found.")]
+
+
+async def _handle_get_ability(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Look up an ability by name."""
+    text = _ability_response(loader, arguments["name"])
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+    return [TextContent(type="text", text=f"Ability '{arguments['name']}' not found.")]
+
+
+async def _handle_get_item(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Look up a held item by name."""
+    text = _item_response(loader, arguments["name"])
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+    return [TextContent(type="text", text=f"Item '{arguments['name']}' not found.")]
+
+
+async def _handle_get_type_effectiveness(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Calculate an attack's multiplier against a set of types."""
+    text = _type_effectiveness_response(
+        loader, arguments["attack_type"], tuple(arguments["defend_types"])
+    )
+    return [TextContent(type="text", text=text)]
+
+
+async def _handle_get_type_matchups(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Calculate one attacking type against many defending type sets."""
+    attack_type = arguments["attack_type"]
+    defenders = arguments["defenders"]
+
+    if not defenders:
+        return [TextContent(type="text", text="No defenders given.")]
+    for defend_types in defenders:
+        if (
+            not isinstance(defend_types, list)
+            or not defend_types
+            or not all(isinstance(t, str) for t in defend_types)
+        ):
+            return [TextContent(
+                type="text",
+                text=f"Invalid defender {defend_types!r}: each defender must be a list of "
+                "type names, e.g. [[\"water\", \"flying\"], [\"fire\"]].",
+            )]
+
+    multipliers = loader.bulk_type_effectiveness([attack_type] * len(defenders), defenders)
+
+    lines = [f"## {attack_type.capitalize()} Type Matchups\n"]
+    for defend_types, multiplier in zip(defenders, multipliers):
+        types_str = "/".join(t.capitalize() for t in defend_types)
+        lines.append(f"- **{types_str}**: {multiplier}x — {_describe_multiplier(multiplier)}")
+
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+async def _handle_search_priority_moves(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """List moves at or above a priority bracket."""
+    min_priority = arguments.get("min_priority", 1)
+    moves = loader.search_moves_by_priority(min_priority)
+
+    if not moves:
+        return [TextContent(type="text", text="No priority moves found.")]
+
+    lines = [f"## Priority Moves (priority >= {min_priority})\n"]
+    for move in moves[:30]:  # Limit to 30
+        priority = move.get("priority", 0)
+        power = move.get("basePower", 0)
+        move_type = move.get("type", "")
+        name = move.get("name", move.get("id", ""))
+        lines.append(f"- **{name}** (+{priority}): {move_type}, {power} power")
+
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+async def _handle_search_pokemon_by_ability(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """List Pokemon that can have an ability."""
+    ability = arguments["ability"]
+    pokemon_list = loader.get_pokemon_with_ability(ability)
+
+    if not pokemon_list:
+        return [TextContent(type="text", text=f"No Pokemon found with ability '{ability}'.")]
+
+    response = f"""## Pokemon with {ability.title()}
+
+Found {len(pokemon_list)} Pokemon:
+{', '.join(pokemon_list[:50])}
 """
-        return [TextContent(type="text", text=response)]
+    if len(pokemon_list) > 50:
+        response += f"\n... and {len(pokemon_list) - 50} more."
 
-    elif name == "search_priority_moves":
-        min_priority = arguments.get("min_priority", 1)
-        moves = loader.search_moves_by_priority(min_priority)
+    return [TextContent(type="text", text=response)]
 
-        if not moves:
-            return [TextContent(type="text", text="No priority moves found.")]
 
-        # Sort by priority descending
-        moves.sort(key=lambda m: m.get("priority", 0), reverse=True)
+async def _handle_list_dangerous_abilities(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """List battle-critical abilities by category."""
+    category = arguments.get("category", "all").lower()
 
-        lines = [f"## Priority Moves (priority >= {min_priority})\n"]
-        for move in moves[:30]:  # Limit to 30
-            priority = move.get("priority", 0)
-            power = move.get("basePower", 0)
-            move_type = move.get("type", "")
-            name = move.get("name", move.get("id", ""))
-            lines.append(f"- **{name}** (+{priority}): {move_type}, {power} power")
+    content = _DANGEROUS_RESPONSES.get(category)
+    if content is None:
+        return [TextContent(type="text", text=f"Unknown category: {category}. {_DANGEROUS_CATEGORY_HINT}")]
 
-        return [TextContent(type="text", text="\n".join(lines))]
+    return [content]
 
-    elif name == "search_pokemon_by_ability":
-        ability = arguments["ability"]
-        pokemon_list = loader.get_pokemon_with_ability(ability)
 
-        if not pokemon_list:
-            return [TextContent(type="text", text=f"No Pokemon found with ability '{ability}'.")]
+# Rendered Smogon responses keyed by tool, arguments and stats month. Only
+# successful renders are stored, so a failed fetch is retried next call.
+# Values are (text, expiry from time.monotonic() or None), least recently
+# used first; the lock covers clears from the stats loader's worker threads.
+_SMOGON_RESPONSES: OrderedDict[tuple, tuple[str, float | None]] = OrderedDict()
+_SMOGON_RESPONSES_MAX = 256
+_SMOGON_RESPONSES_LOCK = threading.Lock()
 
-        response = f"""## Pokemon with {ability.title()}
 
-Found {len(pokemon_list)} Pokemon:
-{', '.join(sorted(pokemon_list)[:50])}
-"""
-        if len(pokemon_list) > 50:
-            response += f"\n... and {len(pokemon_list) - 50} more."
-
-        return [TextContent(type="text", text=response)]
-
-    elif name == "list_dangerous_abilities":
-        category = arguments.get("category", "all").lower()
-
-        DANGEROUS_ABILITIES = {
-            "immunity": {
-                "Levitate": "Immune to Ground moves",
-                "Flash Fire": "Immune to Fire moves, boosts own Fire attacks",
-                "Volt Absorb": "Immune to Electric, heals instead",
-                "Water Absorb": "Immune to Water, heals instead",
-                "Dry Skin": "Immune to Water (heals), weak to Fire",
-                "Lightning Rod": "Immune to Electric, boosts Sp.Atk",
-                "Motor Drive": "Immune to Electric, boosts Speed",
-                "Storm Drain": "Immune to Water, boosts Sp.Atk",
-                "Sap Sipper": "Immune to Grass, boosts Attack",
-                "Earth Eater": "Immune to Ground, heals instead",
-                "Wonder Guard": "Only super effective moves deal damage!",
-            },
-            "defense": {
-                "Fur Coat": "Doubles Defense (halves physical damage)",
-                "Ice Scales": "Halves Special damage",
-                "Fluffy": "Halves contact damage (but 2x Fire damage)",
-                "Multiscale": "Halves damage at full HP",
-                "Shadow Shield": "Halves damage at full HP",
-                "Sturdy": "Survives any hit at full HP with 1 HP",
-                "Filter": "Reduces super effective damage by 25%",
-                "Solid Rock": "Reduces super effective damage by 25%",
-                "Prism Armor": "Reduces super effective damage by 25%",
-                "Thick Fat": "Halves Fire and Ice damage",
-                "Heatproof": "Halves Fire damage",
-                "Water Bubble": "Halves Fire damage, doubles Water attacks",
-                "Unaware": "Ignores opponent's stat boosts",
-                "Marvel Scale": "1.5x Defense when statused",
-            },
-            "reflect": {
-                "Magic Bounce": "Reflects status moves (Stealth Rock, Thunder Wave, etc.)",
-            },
-            "offense": {
-                "Huge Power": "Doubles Attack stat!",
-                "Pure Power": "Doubles Attack stat!",
-                "Adaptability": "STAB becomes 2x instead of 1.5x",
-                "Technician": "1.5x boost to moves with 60 BP or less",
-                "Tinted Lens": "Doubles 'not very effective' damage",
-                "Protean": "Changes type to match used move (always STAB)",
-                "Libero": "Changes type to match used move (always STAB)",
-            },
-            "priority": {
-                "Prankster": "+1 priority to status moves",
-                "Gale Wings": "+1 priority to Flying moves at full HP",
-            },
-            "contact": {
-                "Rough Skin": "1/8 damage to attacker on contact",
-                "Iron Barbs": "1/8 damage to attacker on contact",
-                "Flame Body": "30% chance to burn on contact",
-                "Static": "30% chance to paralyze on contact",
-                "Poison Point": "30% chance to poison on contact",
-            }
-        }
+def _smogon_key(*parts: Any) -> tuple:
+    """Build a response cache key that rolls over with the stats month."""
+    return (*parts, _get_latest_month())
+
+
+def _cached_smogon_response(key: tuple) -> str | None:
+    """Return a rendered response, marking it as the most recently used."""
+    with _SMOGON_RESPONSES_LOCK:
+        entry = _SMOGON_RESPONSES.get(key)
+        if entry is None:
+            return None
+        text, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del _SMOGON_RESPONSES[key]
+            return None
+        _SMOGON_RESPONSES.move_to_end(key)
+        return text
+
+
+def _remember_smogon_response(key: tuple, text: str, fallback: bool = False) -> None:
+    """Store a rendered response, evicting the least recently used when full.
+
+    Responses rendered from the previous month's stats (``fallback``) expire
+    with the stats loader's miss record, so the latest month is checked again.
+    """
+    expires_at = time.monotonic() + MISS_MAX_AGE_HOURS * 3600 if fallback else None
+    with _SMOGON_RESPONSES_LOCK:
+        if key not in _SMOGON_RESPONSES and len(_SMOGON_RESPONSES) >= _SMOGON_RESPONSES_MAX:
+            _SMOGON_RESPONSES.popitem(last=False)
+        _SMOGON_RESPONSES[key] = (text, expires_at)
+
+
+def _invalidate_smogon_caches() -> None:
+    """Drop rendered Smogon responses, e.g. after newer stats are loaded."""
+    with _SMOGON_RESPONSES_LOCK:
+        _SMOGON_RESPONSES.clear()
+
+
+get_stats_loader().on_new_stats = _invalidate_smogon_caches
+
+
+async def _handle_get_smogon_usage(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """List the most used Pokemon in a format."""
+    format_id = arguments["format"]
+    top_n = arguments.get("top_n", 20)
+    key = _smogon_key("usage", format_id, top_n)
+    text = _cached_smogon_response(key)
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+
+    top_pokemon = await asyncio.to_thread(stats_loader.get_top_pokemon, format_id, top_n)
+
+    if not top_pokemon:
+        return [TextContent(type="text", text=f"No usage data found for format '{format_id}'. Try formats like 'gen9ou', 'gen9vgc2025', 'gen9uu'.")]
+
+    lines = [f"## Top {len(top_pokemon)} Pokemon in {format_id}\n"]
+    for i, poke in enumerate(top_pokemon, 1):
+        top_moves = list(poke.moves.keys())[:4]
+        moves_str = ", ".join(top_moves) if top_moves else "N/A"
+        lines.append(f"{i}. **{poke.name}** (usage count: {poke.raw_count:,})")
+        lines.append(f"   Top moves: {moves_str}")
+
+    text = "\n".join(lines)
+    _remember_smogon_response(key, text, stats_loader.serves_fallback(format_id))
+    return [TextContent(type="text", text=text)]
+
+
+async def _handle_get_smogon_sets(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Show competitive set data for a Pokemon."""
+    pokemon_name = arguments["pokemon"]
+    format_id = arguments["format"]
+    key = _smogon_key("sets", pokemon_name, format_id)
+    text = _cached_smogon_response(key)
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+
+    poke_data = await asyncio.to_thread(stats_loader.get_pokemon, pokemon_name, format_id)
+
+    if poke_data is None:
+        return [TextContent(type="text", text=f"No data found for '{pokemon_name}' in {format_id}.")]
+
+    lines = [f"## {poke_data.name} — Competitive Data ({format_id})\n"]
+    append = lines.append
+
+    if poke_data.abilities:
+        append("### Abilities")
+        for ab_name, pct in sorted(poke_data.abilities.items(), key=_BY_VALUE, reverse=True):
+            append(f"- {ab_name}: {pct:.1f}%")
+        append("")
+
+    if poke_data.items:
+        append("### Items")
+        for it_name, pct in sorted(poke_data.items.items(), key=_BY_VALUE, reverse=True):
+            append(f"- {it_name}: {pct:.1f}%")
+        append("")
+
+    if poke_data.moves:
+        append("### Moves")
+        for mv_name, pct in sorted(poke_data.moves.items(), key=_BY_VALUE, reverse=True):
+            append(f"- {mv_name}: {pct:.1f}%")
+        append("")
+
+    if poke_data.spreads:
+        append("### EV Spreads")
+        for spread, pct in heapq.nlargest(5, poke_data.spreads.items(), key=_BY_VALUE):
+            append(f"- {spread}: {pct:.1f}%")
+        append("")
+
+    if poke_data.tera_types:
+        append("### Tera Types")
+        for tera, pct in sorted(poke_data.tera_types.items(), key=_BY_VALUE, reverse=True):
+            append(f"- {tera}: {pct:.1f}%")
+        append("")
+
+    if poke_data.teammates:
+        append("### Common Teammates")
+        for teammate, pct in heapq.nlargest(10, poke_data.teammates.items(), key=_BY_VALUE):
+            append(f"- {teammate}: {pct:.1f}%")
+
+    text = _NL.join(lines)
+    _remember_smogon_response(key, text, stats_loader.serves_fallback(format_id))
+    return [TextContent(type="text", text=text)]
+
+
+async def _handle_get_pokemon_counters(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Show checks and counters for a Pokemon."""
+    pokemon_name = arguments["pokemon"]
+    format_id = arguments["format"]
+    key = _smogon_key("counters", pokemon_name, format_id)
+    text = _cached_smogon_response(key)
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+
+    counters = await asyncio.to_thread(stats_loader.get_counters, pokemon_name, format_id)
+
+    if not counters:
+        return [TextContent(type="text", text=f"No counter data found for '{pokemon_name}' in {format_id}.")]
+
+    lines = [f"## Checks and Counters for {pokemon_name} ({format_id})\n"]
+    for counter in counters:
+        get = counter.get
+        name_str = counter["name"]
+        score = get("score", 0)
+        koed = get("koed_pct", 0)
+        switched = get("switched_pct", 0)
+        lines.append(f"- **{name_str}** (score: {score:.1f})")
+        lines.append(f"  KOed {pokemon_name}: {koed:.1f}% | Forced switch: {switched:.1f}%")
+
+    text = "\n".join(lines)
+    _remember_smogon_response(key, text, stats_loader.serves_fallback(format_id))
+    return [TextContent(type="text", text=text)]
+
+
+async def _handle_get_pokemon_teammates(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Show common teammates for a Pokemon."""
+    pokemon_name = arguments["pokemon"]
+    format_id = arguments["format"]
+    key = _smogon_key("teammates", pokemon_name, format_id)
+    text = _cached_smogon_response(key)
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+
+    teammates = await asyncio.to_thread(stats_loader.get_teammates, pokemon_name, format_id)
+
+    if not teammates:
+        return [TextContent(type="text", text=f"No teammate data found for '{pokemon_name}' in {format_id}.")]
+
+    lines = [f"## Best Teammates for {pokemon_name} ({format_id})\n"]
+    for teammate, pct in sorted(teammates.items(), key=_BY_VALUE, reverse=True):
+        lines.append(f"- **{teammate}**: {pct:.1f}% co-occurrence")
+
+    text = "\n".join(lines)
+    _remember_smogon_response(key, text, stats_loader.serves_fallback(format_id))
+    return [TextContent(type="text", text=text)]
+
+
+async def _handle_search_pokemon_by_stat(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Filter Pokemon by a base stat range."""
+    stat = arguments["stat"]
+    min_val = arguments.get("min_value", 0)
+    max_val = arguments.get("max_value", 999)
+    types = arguments.get("types")
+    tier = arguments.get("tier")
+
+    results = loader.search_pokemon_by_stat(stat, min_val, max_val, types, tier)
+
+    if not results:
+        return [TextContent(type="text", text="No Pokemon found matching the criteria.")]
+
+    # Limit output
+    shown = results[:30]
+    lines = [f"## Pokemon Search Results ({len(results)} found, showing top {len(shown)})\n"]
+    lines.append(f"**Filter:** {stat} between {min_val}-{max_val}")
+    if types:
+        lines.append(f"**Types:** {', '.join(types)}")
+    if tier:
+        lines.append(f"**Tier:** {tier}")
+    lines.append("")
+
+    for entry in shown:
+        base_stats = entry.get("baseStats", {})
+        stat_line = f"HP:{base_stats.get('hp','?')} Atk:{base_stats.get('atk','?')} Def:{base_stats.get('def','?')} SpA:{base_stats.get('spa','?')} SpD:{base_stats.get('spd','?')} Spe:{base_stats.get('spe','?')}"
+        types_str = "/".join(entry.get("types", []))
+        lines.append(f"- **{entry['name']}** ({types_str}) [{entry.get('tier', '?')}] — {stat_line}")
+
+    if len(results) > 30:
+        lines.append(f"\n... and {len(results) - 30} more.")
+
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+def _format_move_line(move: dict) -> str:
+    """Render one search_moves_by_effect result as a markdown bullet."""
+    get = move.get
+    power = get("basePower", 0)
+    priority = get("priority", 0)
+    extras = [
+        extra
+        for extra in (
+            f"{power} BP" if power > 0 else None,
+            f"+{priority} priority" if priority > 0 else None,
+            "spread" if get("target", "") in ("allAdjacentFoes", "allAdjacent") else None,
+        )
+        if extra
+    ]
+    extra_str = f" ({', '.join(extras)})" if extras else ""
+    return f"- **{get('name', get('id', ''))}** — {get('type', '')} {get('category', '')}{extra_str}"
 
-        lines = ["## Dangerous Abilities\n"]
-        categories_to_show = [category] if category != "all" else list(DANGEROUS_ABILITIES.keys())
-
-        for cat in categories_to_show:
-            if cat in DANGEROUS_ABILITIES:
-                lines.append(f"### {cat.title()}\n")
-                for ability_name, desc in DANGEROUS_ABILITIES[cat].items():
-                    lines.append(f"- **{ability_name}**: {desc}")
-                lines.append("")
-
-        if len(lines) == 1:
-            return [TextContent(type="text", text=f"Unknown category: {category}. Use 'immunity', 'defense', 'reflect', 'offense', 'priority', 'contact', or 'all'.")]
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "get_smogon_usage":
-        format_id = arguments["format"]
-        top_n = arguments.get("top_n", 20)
-        stats_loader = get_stats_loader()
-        top_pokemon = stats_loader.get_top_pokemon(format_id, top_n)
-
-        if not top_pokemon:
-            return [TextContent(type="text", text=f"No usage data found for format '{format_id}'. Try formats like 'gen9ou', 'gen9vgc2025', 'gen9uu'.")]
-
-        lines = [f"## Top {len(top_pokemon)} Pokemon in {format_id}\n"]
-        for i, poke in enumerate(top_pokemon, 1):
-            top_moves = list(poke.moves.keys())[:4]
-            moves_str = ", ".join(top_moves) if top_moves else "N/A"
-            lines.append(f"{i}. **{poke.name}** (usage count: {poke.raw_count:,})")
-            lines.append(f"   Top moves: {moves_str}")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "get_smogon_sets":
-        pokemon_name = arguments["pokemon"]
-        format_id = arguments["format"]
-        stats_loader = get_stats_loader()
-        poke_data = stats_loader.get_pokemon(pokemon_name, format_id)
-
-        if poke_data is None:
-            return [TextContent(type="text", text=f"No data found for '{pokemon_name}' in {format_id}.")]
-
-        lines = [f"## {poke_data.name} — Competitive Data ({format_id})\n"]
-
-        if poke_data.abilities:
-            lines.append("### Abilities")
-            for ab_name, pct in sorted(poke_data.abilities.items(), key=lambda x: -x[1]):
-                lines.append(f"- {ab_name}: {pct:.1f}%")
-            lines.append("")
-
-        if poke_data.items:
-            lines.append("### Items")
-            for it_name, pct in sorted(poke_data.items.items(), key=lambda x: -x[1]):
-                lines.append(f"- {it_name}: {pct:.1f}%")
-            lines.append("")
-
-        if poke_data.moves:
-            lines.append("### Moves")
-            for mv_name, pct in sorted(poke_data.moves.items(), key=lambda x: -x[1]):
-                lines.append(f"- {mv_name}: {pct:.1f}%")
-            lines.append("")
-
-        if poke_data.spreads:
-            lines.append("### EV Spreads")
-            for spread, pct in sorted(poke_data.spreads.items(), key=lambda x: -x[1])[:5]:
-                lines.append(f"- {spread}: {pct:.1f}%")
-            lines.append("")
-
-        if poke_data.tera_types:
-            lines.append("### Tera Types")
-            for tera, pct in sorted(poke_data.tera_types.items(), key=lambda x: -x[1]):
-                lines.append(f"- {tera}: {pct:.1f}%")
-            lines.append("")
-
-        if poke_data.teammates:
-            lines.append("### Common Teammates")
-            for teammate, pct in sorted(poke_data.teammates.items(), key=lambda x: -x[1])[:10]:
-                lines.append(f"- {teammate}: {pct:.1f}%")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "get_pokemon_counters":
-        pokemon_name = arguments["pokemon"]
-        format_id = arguments["format"]
-        stats_loader = get_stats_loader()
-        counters = stats_loader.get_counters(pokemon_name, format_id)
-
-        if not counters:
-            return [TextContent(type="text", text=f"No counter data found for '{pokemon_name}' in {format_id}.")]
-
-        lines = [f"## Checks and Counters for {pokemon_name} ({format_id})\n"]
-        for counter in counters:
-            name_str = counter["name"]
-            score = counter.get("score", 0)
-            koed = counter.get("koed_pct", 0)
-            switched = counter.get("switched_pct", 0)
-            lines.append(f"- **{name_str}** (score: {score:.1f})")
-            lines.append(f"  KOed {pokemon_name}: {koed:.1f}% | Forced switch: {switched:.1f}%")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "get_pokemon_teammates":
-        pokemon_name = arguments["pokemon"]
-        format_id = arguments["format"]
-        stats_loader = get_stats_loader()
-        teammates = stats_loader.get_teammates(pokemon_name, format_id)
-
-        if not teammates:
-            return [TextContent(type="text", text=f"No teammate data found for '{pokemon_name}' in {format_id}.")]
-
-        lines = [f"## Best Teammates for {pokemon_name} ({format_id})\n"]
-        for teammate, pct in sorted(teammates.items(), key=lambda x: -x[1]):
-            lines.append(f"- **{teammate}**: {pct:.1f}% co-occurrence")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "search_pokemon_by_stat":
-        stat = arguments["stat"]
-        min_val = arguments.get("min_value", 0)
-        max_val = arguments.get("max_value", 999)
-        types = arguments.get("types")
-        tier = arguments.get("tier")
-
-        results = loader.search_pokemon_by_stat(stat, min_val, max_val, types, tier)
-
-        if not results:
-            return [TextContent(type="text", text="No Pokemon found matching the criteria.")]
-
-        # Limit output
-        shown = results[:30]
-        lines = [f"## Pokemon Search Results ({len(results)} found, showing top {len(shown)})\n"]
-        lines.append(f"**Filter:** {stat} between {min_val}-{max_val}")
-        if types:
-            lines.append(f"**Types:** {', '.join(types)}")
-        if tier:
-            lines.append(f"**Tier:** {tier}")
-        lines.append("")
 
-        for entry in shown:
-            base_stats = entry.get("baseStats", {})
-            stat_line = f"HP:{base_stats.get('hp','?')} Atk:{base_stats.get('atk','?')} Def:{base_stats.get('def','?')} SpA:{base_stats.get('spa','?')} SpD:{base_stats.get('spd','?')} Spe:{base_stats.get('spe','?')}"
-            types_str = "/".join(entry.get("types", []))
-            lines.append(f"- **{entry['name']}** ({types_str}) [{entry.get('tier', '?')}] — {stat_line}")
-
-        if len(results) > 30:
-            lines.append(f"\n... and {len(results) - 30} more.")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "search_moves_by_effect":
-        effect = arguments["effect"]
-        move_type = arguments.get("move_type")
-
-        results = loader.search_moves_by_effect(effect, move_type)
-
-        if not results:
-            categories = list(loader.MOVE_EFFECT_CATEGORIES.keys())
-            return [TextContent(type="text", text=f"No moves found for effect '{effect}'. Available categories: {', '.join(categories)}")]
-
-        lines = [f"## {effect.replace('_', ' ').title()} Moves ({len(results)} found)\n"]
-        if move_type:
-            lines.append(f"**Type filter:** {move_type}\n")
-
-        for move in results[:30]:
-            power = move.get("basePower", 0)
-            mtype = move.get("type", "")
-            cat = move.get("category", "")
-            priority = move.get("priority", 0)
-            mname = move.get("name", move.get("id", ""))
-
-            extras = []
-            if power > 0:
-                extras.append(f"{power} BP")
-            if priority > 0:
-                extras.append(f"+{priority} priority")
-            target = move.get("target", "")
-            if target in ("allAdjacentFoes", "allAdjacent"):
-                extras.append("spread")
-
-            extra_str = f" ({', '.join(extras)})" if extras else ""
-            lines.append(f"- **{mname}** — {mtype} {cat}{extra_str}")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "get_format_info":
-        format_id = arguments["format"].lower()
-
-        FORMAT_INFO: dict[str, dict[str, Any]] = {
-            "gen9ou": {
-                "name": "Generation 9 OverUsed (OU)",
-                "game": "Scarlet & Violet",
-                "type": "Singles (6v6, bring 6 pick 6)",
-                "level": 100,
-                "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause", "OHKO Clause", "Moody Clause"],
-                "key_bans": ["Uber-tier Pokemon (Koraidon, Miraidon, etc.)", "Arena Trap", "Shadow Tag", "Baton Pass"],
-                "meta_notes": "The standard competitive singles format. Terastallization available. Heavy emphasis on hazard control, pivoting, and offensive pressure.",
-            },
-            "gen9uu": {
-                "name": "Generation 9 UnderUsed (UU)",
-                "game": "Scarlet & Violet",
-                "type": "Singles (6v6)",
-                "level": 100,
-                "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause", "OHKO Clause"],
-                "key_bans": ["OU and above Pokemon by usage", "Arena Trap", "Shadow Tag"],
-                "meta_notes": "Pokemon that don't see enough play in OU. Often features creative sets and underrated threats.",
-            },
-            "gen9ubers": {
-                "name": "Generation 9 Ubers",
-                "game": "Scarlet & Violet",
-                "type": "Singles (6v6)",
-                "level": 100,
-                "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause"],
-                "key_bans": ["Mega Rayquaza (AG only)"],
-                "meta_notes": "Legendary and mythical Pokemon dominate. Extremely high power level. Koraidon, Miraidon, and Calyrex forms are staples.",
-            },
-            "gen9vgc2025": {
-                "name": "VGC 2025 (Regulation H)",
-                "game": "Scarlet & Violet",
-                "type": "Doubles (bring 6, pick 4)",
-                "level": 50,
-                "clauses": ["Species Clause", "Item Clause"],
-                "key_bans": ["Restricted legends limited (check current regulation)"],
-                "meta_notes": "Official doubles format. Level 50, bring 6 pick 4. Speed control (Tailwind, Trick Room), redirection, Fake Out, and spread moves are critical. Protect is almost mandatory.",
-            },
-            "gen9doublesou": {
-                "name": "Generation 9 Doubles OU",
-                "game": "Scarlet & Violet",
-                "type": "Doubles (6v6, bring 6 pick 6)",
-                "level": 100,
-                "clauses": ["Species Clause", "Sleep Clause", "Evasion Clause"],
-                "key_bans": ["Uber-tier doubles Pokemon"],
-                "meta_notes": "Smogon doubles format. Level 100, bring all 6. More Pokemon variety than VGC. Spread moves, positioning, and speed control are key.",
-            },
-            "gen9randombattle": {
-                "name": "Generation 9 Random Battle",
-                "game": "Scarlet & Violet",
-                "type": "Singles (random teams)",
-                "level": "Varies (scaled by BST)",
-                "clauses": ["Random teams assigned"],
-                "key_bans": [],
-                "meta_notes": "Random teams with pre-built sets. Tests adaptability and game knowledge. Popular for casual play.",
-            },
-        }
+async def _handle_search_moves_by_effect(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Find moves by strategic effect category."""
+    effect = arguments["effect"]
+    move_type = arguments.get("move_type")
 
-        info = FORMAT_INFO.get(format_id)
-        if info is None:
-            available = ", ".join(sorted(FORMAT_INFO.keys()))
-            return [TextContent(type="text", text=f"Format '{format_id}' not found. Available formats: {available}")]
+    results = loader.search_moves_by_effect(effect, move_type)
 
-        lines = [f"## {info['name']}\n"]
-        lines.append(f"**Game:** {info['game']}")
-        lines.append(f"**Type:** {info['type']}")
-        lines.append(f"**Level:** {info['level']}")
-        lines.append("")
+    if not results:
+        categories = list(loader.MOVE_EFFECT_CATEGORIES.keys())
+        return [TextContent(type="text", text=f"No moves found for effect '{effect}'. Available categories: {', '.join(categories)}")]
 
-        if info["clauses"]:
-            lines.append("### Clauses")
-            for clause in info["clauses"]:
-                lines.append(f"- {clause}")
-            lines.append("")
+    lines = [f"## {effect.replace('_', ' ').title()} Moves ({len(results)} found)\n"]
+    if move_type:
+        lines.append(f"**Type filter:** {move_type}\n")
 
-        if info["key_bans"]:
-            lines.append("### Key Bans")
-            for ban in info["key_bans"]:
-                lines.append(f"- {ban}")
-            lines.append("")
+    lines.extend([_format_move_line(move) for move in results[:30]])
 
-        lines.append("### Meta Notes")
-        lines.append(info["meta_notes"])
+    return [TextContent(type="text", text="\n".join(lines))]
 
-        return [TextContent(type="text", text="\n".join(lines))]
 
-    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+async def _handle_get_format_info(
+    loader: PokemonDataLoader, stats_loader: SmogonStatsLoader, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Describe a competitive format's rules and meta."""
+    format_id = arguments["format"].lower()
+
+    content = _FORMAT_INFO_RESPONSES.get(format_id)
+    if content is None:
+        return [TextContent(type="text", text=f"Format '{format_id}' not found. Available formats: {_FORMAT_NAMES}")]
+
+    return [content]
+
+
+# Tool name -> handler, so call_tool is a single dict lookup
+_HANDLERS: dict[str, Callable[..., Awaitable[list[TextContent]]]] = {
+    "get_pokemon": _handle_get_pokemon,
+    "get_move": _handle_get_move,
+    "get_ability": _handle_get_ability,
+    "get_item": _handle_get_item,
+    "get_type_effectiveness": _handle_get_type_effectiveness,
+    "get_type_matchups": _handle_get_type_matchups,
+    "search_priority_moves": _handle_search_priority_moves,
+    "search_pokemon_by_ability": _handle_search_pokemon_by_ability,
+    "list_dangerous_abilities": _handle_list_dangerous_abilities,
+    "get_smogon_usage": _handle_get_smogon_usage,
+    "get_smogon_sets": _handle_get_smogon_sets,
+    "get_pokemon_counters": _handle_get_pokemon_counters,
+    "get_pokemon_teammates": _handle_get_pokemon_teammates,
+    "search_pokemon_by_stat": _handle_search_pokemon_by_stat,
+    "search_moves_by_effect": _handle_search_moves_by_effect,
+    "get_format_info": _handle_get_format_info,
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(get_loader(), get_stats_loader(), arguments)
+
+
+def _preload() -> None:
+    """Load the game data up front so no tool call parses JSON on the event loop."""
+    get_loader().load_all()
+    get_stats_loader()
 
 
 async def _async_main():
     """Async entry point for the MCP server."""
+    _preload()
+    # Optionally warm the Smogon stats for common formats while the server runs
+    formats = [f.strip() for f in os.environ.get(PREFETCH_FORMATS_ENV, "").split(",") if f.strip()]
+    prefetch = asyncio.create_task(get_stats_loader().prefetch(formats)) if formats else None
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
+    if prefetch is not None:
+        prefetch.cancel()
 
 
 def main():
     """Run the MCP server (synchronous entry point)."""
-    import asyncio
-    asyncio.run(_async_main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_async_main())
+    else:
+        uvloop.run(_async_main())
 
 
 if __name__ == "__main__":
@@ -5,21 +5,79 @@ Fetches competitive usage statistics from Smogon's stats archives.
 Provides Pokemon usage data, movesets, teammates, and counters for team building.
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import re
+import sys
+import threading
+import time
 import urllib.request
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None  # type: ignore[assignment]
+
 
 SMOGON_STATS_URL = "https://www.smogon.com/stats"
+USER_AGENT = "mcpkmn-showdown/1.1"
 STATS_CACHE_DIR = Path(__file__).parent / "cache" / "stats"
 CACHE_MAX_AGE_DAYS = 30
-
-
-@dataclass
+# Months that Smogon has not published yet are remembered for a much shorter
+# time, so a missing month is retried a few times a day rather than per call.
+MISS_MAX_AGE_HOURS = 6
+# Parsed format/month tables held in memory per loader, least recently used evicted first
+MEMORY_CACHE_MAX = 8
+# Locks serializing loads of the same format/month, shared by hash of the key
+_LOAD_LOCK_STRIPES = 16
+
+# Comma-separated formats (e.g. "gen9ou,gen9vgc2025") to load when the server starts
+PREFETCH_FORMATS_ENV = "MCPKMN_PREFETCH_FORMATS"
+
+# Format ids and months become file names, so only these shapes are accepted
+_FORMAT_ID_RE = re.compile(r"[a-z0-9]+")
+_YEAR_MONTH_RE = re.compile(r"\d{4}-\d{2}")
+
+# Per-line patterns used by the stats parser, compiled once at import.
+_CC_RE = re.compile(r'^(.+?)\s+([\d.]+)\s+\(([\d.]+)±([\d.]+)\)\s*$')
+_KO_RE = re.compile(r'([\d.]+)%\s*KOed')
+_SW_RE = re.compile(r'([\d.]+)%\s*switched out')
+_BORDER_RE = re.compile(r'^\s*\+[-+]+\+\s*$')
+
+# The usual three-line raw stats section, each line wrapped in "|" borders
+_RAW_STATS_RE = re.compile(
+    r'[^\S\n]*\|*[^\S\n]*Raw count:[^\S\n]*(\d+)[^\S\n]*\|*[^\S\n]*\n'
+    r'[^\S\n]*\|*[^\S\n]*Avg\. weight:[^\S\n]*([\d.eE+-]+)[^\S\n]*\|*[^\S\n]*\n'
+    r'[^\S\n]*\|*[^\S\n]*Viability Ceiling:[^\S\n]*(\d+)[^\S\n]*\|*[^\S\n]*'
+)
+
+# Shared connection pool so repeated fetches reuse the TLS connection to
+# smogon.com; falls back to a fresh urllib.request connection per fetch.
+_http = (
+    urllib3.PoolManager(
+        num_pools=4, maxsize=8, timeout=30.0, headers={"User-Agent": USER_AGENT}
+    )
+    if urllib3 is not None
+    else None
+)
+
+
+@dataclass(slots=True)
 class PokemonUsageData:
     """Competitive usage data for a single Pokemon in a format."""
     name: str
@@ -34,6 +92,31 @@ class PokemonUsageData:
     teammates: dict[str, float] = field(default_factory=dict)
     checks_and_counters: list[dict[str, Any]] = field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PokemonUsageData":
+        """Build an instance from its asdict() form, as stored in the cache."""
+        get = data.get
+        # Positional, in field order: cheaper than unpacking a kwargs dict per row
+        return cls(
+            data["name"],
+            get("raw_count", 0),
+            get("avg_weight", 0.0),
+            get("viability_ceiling", 0),
+            get("abilities", {}),
+            get("items", {}),
+            get("spreads", {}),
+            get("moves", {}),
+            get("tera_types", {}),
+            get("teammates", {}),
+            get("checks_and_counters", []),
+        )
+
+
+@lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    """Normalize a Pokemon name to its stats key (lowercase, no spaces or hyphens)."""
+    return name.lower().replace(" ", "").replace("-", "")
+
 
 def _get_latest_month() -> str:
     """Get the most likely available stats month (previous month)."""
@@ -47,11 +130,38 @@ def _get_latest_month() -> str:
     return target.strftime("%Y-%m")
 
 
+def _previous_month(year_month: str) -> str | None:
+    """Get the "YYYY-MM" month before year_month, or None if it is malformed."""
+    try:
+        first = datetime.strptime(year_month, "%Y-%m")
+    except ValueError:
+        return None
+    return (first - timedelta(days=1)).strftime("%Y-%m")
+
+
 def _get_cache_path(format_id: str, rating: int, year_month: str) -> Path:
     """Get the cache file path for given parameters."""
     return STATS_CACHE_DIR / f"stats_{format_id}_{rating}_{year_month}.json"
 
 
+def _get_miss_path(format_id: str, rating: int, year_month: str) -> Path:
+    """Get the sentinel path marking stats that could not be fetched."""
+    return STATS_CACHE_DIR / f"stats_{format_id}_{rating}_{year_month}.miss"
+
+
+def _text_digest(raw_text: str) -> str:
+    """Fingerprint fetched stats text so unchanged downloads can skip parsing."""
+    return hashlib.blake2b(raw_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _is_miss_fresh(miss_path: Path) -> bool:
+    """Check if a miss sentinel exists and is recent enough to trust."""
+    if not miss_path.exists():
+        return False
+    mtime = datetime.fromtimestamp(miss_path.stat().st_mtime)
+    return (datetime.now() - mtime) < timedelta(hours=MISS_MAX_AGE_HOURS)
+
+
 def _is_cache_fresh(cache_path: Path) -> bool:
     """Check if a cache file exists and is not stale."""
     if not cache_path.exists():
@@ -64,7 +174,10 @@ def _fetch_stats_text(format_id: str, rating: int, year_month: str) -> str | Non
     """Fetch raw stats text from Smogon."""
     url = f"{SMOGON_STATS_URL}/{year_month}/moveset/{format_id}-{rating}.txt"
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "mcpkmn-showdown/1.1"})
+        if _http is not None:
+            resp = _http.request("GET", url)
+            return resp.data.decode("utf-8") if resp.status == 200 else None
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
             return response.read().decode("utf-8")
     except Exception:
@@ -76,22 +189,26 @@ def _parse_section_entries(lines: list[str]) -> dict[str, float]:
     result = {}
     for line in lines:
         line = line.strip().strip("|").strip()
-        if not line:
+        # Split off the trailing "37.651%" token: name, whitespace, percentage
+        parts = line.rsplit(None, 1)
+        if len(parts) != 2:
+            continue
+        name, pct = parts
+        if not pct.endswith("%") or not pct[:-1].replace(".", "").isdecimal():
+            continue
+        if name.lower() == "other":
+            continue
+        try:
+            result[sys.intern(name)] = float(pct[:-1])
+        except ValueError:
             continue
-        # Match: name followed by percentage
-        match = re.match(r'^(.+?)\s+([\d.]+)%\s*$', line)
-        if match:
-            name = match.group(1).strip()
-            if name.lower() == "other":
-                continue
-            pct = float(match.group(2))
-            result[name] = pct
     return result
 
 
 def _parse_checks_and_counters(lines: list[str]) -> list[dict[str, Any]]:
     """Parse checks and counters section."""
     results = []
+    cc_match, ko_search, sw_search = _CC_RE.match, _KO_RE.search, _SW_RE.search
     i = 0
     while i < len(lines):
         line = lines[i].strip().strip("|").strip()
@@ -100,9 +217,9 @@ def _parse_checks_and_counters(lines: list[str]) -> list[dict[str, Any]]:
             continue
 
         # Match: "Pokemon Name 54.493 (78.40±5.98)"
-        match = re.match(r'^(.+?)\s+([\d.]+)\s+\(([\d.]+)±([\d.]+)\)\s*$', line)
+        match = cc_match(line)
         if match:
-            name = match.group(1).strip()
+            name = sys.intern(match.group(1).strip())
             score = float(match.group(2))
             mean = float(match.group(3))
             std = float(match.group(4))
@@ -112,8 +229,8 @@ def _parse_checks_and_counters(lines: list[str]) -> list[dict[str, Any]]:
             # Check next line for KO/switch details
             if i + 1 < len(lines):
                 detail_line = lines[i + 1].strip().strip("|").strip()
-                ko_match = re.search(r'([\d.]+)%\s*KOed', detail_line)
-                sw_match = re.search(r'([\d.]+)%\s*switched out', detail_line)
+                ko_match = ko_search(detail_line)
+                sw_match = sw_search(detail_line)
                 if ko_match:
                     entry["koed_pct"] = float(ko_match.group(1))
                 if sw_match:
@@ -126,6 +243,66 @@ def _parse_checks_and_counters(lines: list[str]) -> list[dict[str, Any]]:
     return results
 
 
+# Lowercased header of each per-Pokemon section after the raw stats ->
+# (PokemonUsageData field, parser for the section's entry lines)
+_SECTION_PARSERS = {
+    "abilities": ("abilities", _parse_section_entries),
+    "items": ("items", _parse_section_entries),
+    "spreads": ("spreads", _parse_section_entries),
+    "moves": ("moves", _parse_section_entries),
+    "tera types": ("tera_types", _parse_section_entries),
+    "teammates": ("teammates", _parse_section_entries),
+    "checks and counters": ("checks_and_counters", _parse_checks_and_counters),
+}
+
+
+def _apply_section(data: PokemonUsageData, index: int, section: list[str]) -> None:
+    """Fill ``data`` from the ``index``-th bordered section of its stats block.
+
+    Section 0 is the Pokemon name, section 1 holds the raw stats and every
+    later section is keyed by its header line.
+    """
+    if index == 1:
+        match = _RAW_STATS_RE.fullmatch("\n".join(section))
+        if match:
+            try:
+                raw_count = int(match.group(1))
+                avg_weight = float(match.group(2))
+                viability_ceiling = int(match.group(3))
+            except ValueError:
+                pass
+            else:
+                data.raw_count = raw_count
+                data.avg_weight = avg_weight
+                data.viability_ceiling = viability_ceiling
+                return
+
+        # Irregular section: pick out whichever fields are present
+        for line in section:
+            line = line.strip().strip("|").strip()
+            if line.startswith("Raw count:"):
+                try:
+                    data.raw_count = int(line.split(":")[1].strip())
+                except (ValueError, IndexError):
+                    pass
+            elif line.startswith("Avg. weight:"):
+                try:
+                    data.avg_weight = float(line.split(":")[1].strip())
+                except (ValueError, IndexError):
+                    pass
+            elif line.startswith("Viability Ceiling:"):
+                try:
+                    data.viability_ceiling = int(line.split(":")[1].strip())
+                except (ValueError, IndexError):
+                    pass
+        return
+
+    parser = _SECTION_PARSERS.get(section[0].strip().strip("|").strip().lower())
+    if parser is not None:
+        attr, parse = parser
+        setattr(data, attr, parse(section[1:]))
+
+
 def _parse_pokemon_block(block: str) -> PokemonUsageData | None:
     """Parse a single Pokemon's stats block."""
     lines = block.strip().split("\n")
@@ -135,7 +312,7 @@ def _parse_pokemon_block(block: str) -> PokemonUsageData | None:
     current_section: list[str] = []
 
     for line in lines:
-        if re.match(r'^\s*\+[-+]+\+\s*$', line):
+        if "+" in line and _BORDER_RE.match(line):
             if current_section:
                 sections.append(current_section)
                 current_section = []
@@ -152,115 +329,94 @@ def _parse_pokemon_block(block: str) -> PokemonUsageData | None:
     if not name_line:
         return None
 
-    data = PokemonUsageData(name=name_line)
+    data = PokemonUsageData(name=sys.intern(name_line))
+    for index in range(1, len(sections)):
+        _apply_section(data, index, sections[index])
+    return data
 
-    # Second section is raw stats
-    if len(sections) > 1:
-        for line in sections[1]:
-            line = line.strip().strip("|").strip()
-            if line.startswith("Raw count:"):
-                try:
-                    data.raw_count = int(line.split(":")[1].strip())
-                except (ValueError, IndexError):
-                    pass
-            elif line.startswith("Avg. weight:"):
-                try:
-                    data.avg_weight = float(line.split(":")[1].strip())
-                except (ValueError, IndexError):
-                    pass
-            elif line.startswith("Viability Ceiling:"):
-                try:
-                    data.viability_ceiling = int(line.split(":")[1].strip())
-                except (ValueError, IndexError):
-                    pass
 
-    # Remaining sections are keyed by header
-    for section in sections[2:]:
-        if not section:
-            continue
-        header = section[0].strip().strip("|").strip().lower()
-        entries = section[1:]
-
-        if header == "abilities":
-            data.abilities = _parse_section_entries(entries)
-        elif header == "items":
-            data.items = _parse_section_entries(entries)
-        elif header == "spreads":
-            data.spreads = _parse_section_entries(entries)
-        elif header == "moves":
-            data.moves = _parse_section_entries(entries)
-        elif header == "tera types":
-            data.tera_types = _parse_section_entries(entries)
-        elif header == "teammates":
-            data.teammates = _parse_section_entries(entries)
-        elif header == "checks and counters":
-            data.checks_and_counters = _parse_checks_and_counters(entries)
+def _iter_stats(raw_text: str) -> Iterator[tuple[str, PokemonUsageData]]:
+    """Yield (normalized name, data) for each Pokemon in a Smogon stats text file.
 
-    return data
+    Each entry is yielded once its block is complete, so callers can consume
+    the file lazily instead of holding every parsed Pokemon at once.
+    """
+    # A Pokemon entry starts with: +---+ / | Name | / +---+
+    # i.e. a single line between two borders that is a Pokemon name
+    # (not a section header like "Abilities" or a "Raw count:" line).
+
+    # Stream the lines once, closing a section at every border and handing
+    # it straight to the Pokemon currently being filled.
+    data: PokemonUsageData | None = None
+    index = 0
+    section: list[str] = []
+    seen_border = False
+    is_border = _BORDER_RE.match
+    for line in raw_text.split("\n"):
+        # Borders are the only lines that need the regex, and they all contain "+"
+        if "+" not in line or not is_border(line):
+            section.append(line)
+            continue
+        if seen_border and len(section) == 1:
+            name = section[0].strip().strip("|").strip()
+            if name and name.lower() not in _SECTION_PARSERS and ":" not in name:
+                if data is not None:
+                    yield _normalize(data.name), data
+                data = PokemonUsageData(name=sys.intern(name))
+                index = 1
+                section = []
+                continue
+        seen_border = True
+        if section:
+            if data is not None:
+                _apply_section(data, index, section)
+                index += 1
+            section = []
+    if data is not None:
+        if section:
+            _apply_section(data, index, section)
+        yield _normalize(data.name), data
 
 
 def _parse_stats(raw_text: str) -> dict[str, PokemonUsageData]:
     """Parse the full Smogon stats text file into a dict of Pokemon data."""
-    results = {}
-    lines = raw_text.split("\n")
-
-    # Find indices of all +---+ border lines
-    border_indices = [
-        i for i, line in enumerate(lines)
-        if re.match(r'^\s*\+[-+]+\+\s*$', line)
-    ]
-
-    # A Pokemon entry starts with: +---+ / | Name | / +---+
-    # Identify these by finding consecutive borders with exactly one line between
-    # where that line is a Pokemon name (not a section header like "Abilities")
-    section_headers = {
-        "abilities", "items", "spreads", "moves", "tera types",
-        "teammates", "checks and counters",
-    }
-    block_starts = []
-    for idx in range(len(border_indices) - 1):
-        b1 = border_indices[idx]
-        b2 = border_indices[idx + 1]
-        if b2 - b1 == 2:
-            between = lines[b1 + 1].strip().strip("|").strip()
-            if between and between.lower() not in section_headers and ":" not in between:
-                block_starts.append(b1)
-
-    # Extract each Pokemon block from its start to the next block's start
-    for i, start in enumerate(block_starts):
-        end = block_starts[i + 1] if i + 1 < len(block_starts) else len(lines)
-        block_text = "\n".join(lines[start:end])
-        pokemon = _parse_pokemon_block(block_text)
-        if pokemon and pokemon.name:
-            key = pokemon.name.lower().replace(" ", "").replace("-", "")
-            results[key] = pokemon
-
-    return results
+    return dict(_iter_stats(raw_text))
 
 
 def _save_to_cache(data: dict[str, PokemonUsageData], cache_path: Path) -> None:
     """Save parsed data to cache as JSON."""
     cache_path.parent.mkdir(parents=True, exist_ok=True)
     serialized = {k: asdict(v) for k, v in data.items()}
+    # Compact output: the cache is only read back by _load_from_cache
+    if orjson is not None:
+        cache_path.write_bytes(orjson.dumps(serialized))
+        return
     with open(cache_path, "w") as f:
-        json.dump(serialized, f, indent=2)
+        json.dump(serialized, f, separators=(",", ":"))
 
 
 def _load_from_cache(cache_path: Path) -> dict[str, PokemonUsageData]:
     """Load parsed data from cache JSON."""
-    with open(cache_path) as f:
-        raw = json.load(f)
-    result = {}
-    for key, val in raw.items():
-        result[key] = PokemonUsageData(**val)
-    return result
+    payload = cache_path.read_bytes()
+    raw = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    from_dict = PokemonUsageData.from_dict
+    return {key: from_dict(val) for key, val in raw.items()}
 
 
 class SmogonStatsLoader:
     """Loads and caches Smogon competitive statistics."""
 
     def __init__(self):
-        self._cache: dict[str, dict[str, PokemonUsageData]] = {}
+        # Least recently used first, so eviction keeps the formats in use
+        self._cache: OrderedDict[str, dict[str, PokemonUsageData]] = OrderedDict()
+        # cache key -> time.monotonic() of the last failed fetch
+        self._misses: dict[str, float] = {}
+        self._misses_lock = threading.Lock()
+        # Fixed pool of locks, picked by cache key hash, held while a key is
+        # fetched and parsed; its size doesn't grow with the formats requested
+        self._locks = tuple(threading.Lock() for _ in range(_LOAD_LOCK_STRIPES))
+        # Called after newly downloaded stats are parsed, e.g. to drop rendered responses
+        self.on_new_stats: Callable[[], None] | None = None
 
     def get_stats(
         self, format_id: str, rating: int = 1825, year_month: str | None = None
@@ -278,44 +434,152 @@ class SmogonStatsLoader:
         """
         if year_month is None:
             year_month = _get_latest_month()
+        # Reject ids that could escape the cache directory before any fetch or file I/O
+        if not _FORMAT_ID_RE.fullmatch(format_id) or not _YEAR_MONTH_RE.fullmatch(year_month):
+            return {}
 
+        data = self._get_month(format_id, rating, year_month)
+        if data is None:
+            # Try the month before if this one isn't published yet
+            prev = _previous_month(year_month)
+            if prev is not None:
+                data = self._get_month(format_id, rating, prev)
+        return data if data is not None else {}
+
+    def serves_fallback(self, format_id: str, rating: int = 1825) -> bool:
+        """Whether get_stats serves the month before, as the latest month isn't loaded."""
+        return f"{format_id}_{rating}_{_get_latest_month()}" not in self._cache
+
+    def _get_month(
+        self, format_id: str, rating: int, year_month: str
+    ) -> dict[str, PokemonUsageData] | None:
+        """Get one month's stats, or None if Smogon has not published them."""
         cache_key = f"{format_id}_{rating}_{year_month}"
 
         # Check memory cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        data = self._cached(cache_key)
+        if data is not None:
+            return data
+
+        # Concurrent callers for the same key wait for one fetch and parse
+        with self._locks[hash(cache_key) % _LOAD_LOCK_STRIPES]:
+            data = self._cached(cache_key)
+            if data is not None:
+                return data
+            return self._load_stats(format_id, rating, year_month, cache_key)
+
+    def _load_stats(
+        self, format_id: str, rating: int, year_month: str, cache_key: str
+    ) -> dict[str, PokemonUsageData] | None:
+        """Load stats missing from the memory cache from disk or Smogon."""
+        # Check recent misses, in memory and then on disk
+        missed_at = self._misses.get(cache_key)
+        if missed_at is not None:
+            if time.monotonic() - missed_at < MISS_MAX_AGE_HOURS * 3600:
+                return None
+            with self._misses_lock:
+                self._misses.pop(cache_key, None)
 
         # Check file cache
         cache_path = _get_cache_path(format_id, rating, year_month)
         if _is_cache_fresh(cache_path):
             data = _load_from_cache(cache_path)
-            self._cache[cache_key] = data
+            self._remember(cache_key, data)
             return data
 
+        miss_path = _get_miss_path(format_id, rating, year_month)
+        if _is_miss_fresh(miss_path):
+            self._record_miss(cache_key)
+            return None
+
         # Fetch and parse
         raw_text = _fetch_stats_text(format_id, rating, year_month)
         if raw_text is None:
-            # Try previous month if current month fails
-            prev = _get_latest_month()
-            if prev != year_month:
-                raw_text = _fetch_stats_text(format_id, rating, prev)
-                if raw_text:
-                    year_month = prev
-
-            if raw_text is None:
-                return {}
-
-        data = _parse_stats(raw_text)
-        _save_to_cache(data, _get_cache_path(format_id, rating, year_month))
-        self._cache[f"{format_id}_{rating}_{year_month}"] = data
+            self._record_miss(cache_key)
+            try:
+                miss_path.parent.mkdir(parents=True, exist_ok=True)
+                miss_path.touch()
+            except OSError:
+                pass
+            return None
+
+        # Smogon often serves identical bytes again; reuse the parsed cache then
+        hash_path = cache_path.with_suffix(".hash")
+        digest = _text_digest(raw_text)
+        try:
+            unchanged = cache_path.exists() and hash_path.read_text() == digest
+        except OSError:
+            unchanged = False
+        if unchanged:
+            data = _load_from_cache(cache_path)
+        else:
+            data = _parse_stats(raw_text)
+            if self.on_new_stats is not None:
+                self.on_new_stats()
+        # The disk cache is best-effort, e.g. when installed into a read-only prefix
+        try:
+            if unchanged:
+                cache_path.touch()
+            else:
+                _save_to_cache(data, cache_path)
+                hash_path.write_text(digest)
+        except OSError:
+            pass
+        self._remember(cache_key, data)
+        return data
+
+    def _record_miss(self, cache_key: str) -> None:
+        """Remember a failed load, dropping miss records that have expired."""
+        now = time.monotonic()
+        max_age = MISS_MAX_AGE_HOURS * 3600
+        with self._misses_lock:
+            misses = self._misses
+            misses.pop(cache_key, None)
+            # Records are kept in time order, so expired ones are at the front
+            while misses:
+                key, missed_at = next(iter(misses.items()))
+                if now - missed_at < max_age:
+                    break
+                del misses[key]
+            misses[cache_key] = now
+
+    def _cached(self, cache_key: str) -> dict[str, PokemonUsageData] | None:
+        """Return stats held in memory, marking them as most recently used."""
+        data = self._cache.get(cache_key)
+        if data is not None:
+            try:
+                self._cache.move_to_end(cache_key)
+            except KeyError:  # evicted by another thread in between
+                pass
         return data
 
+    def _remember(self, cache_key: str, data: dict[str, PokemonUsageData]) -> None:
+        """Keep parsed stats in memory, evicting the least recently used when full."""
+        if cache_key not in self._cache and len(self._cache) >= MEMORY_CACHE_MAX:
+            self._cache.popitem(last=False)
+        self._cache[cache_key] = data
+
+    async def get_stats_async(
+        self, format_id: str, rating: int = 1825, year_month: str | None = None
+    ) -> dict[str, PokemonUsageData]:
+        """Like get_stats, but fetches and parses in a worker thread on a cache miss."""
+        if year_month is None:
+            year_month = _get_latest_month()
+        data = self._cached(f"{format_id}_{rating}_{year_month}")
+        if data is not None:
+            return data
+        return await asyncio.to_thread(self.get_stats, format_id, rating, year_month)
+
+    async def prefetch(self, formats: list[str], rating: int = 1825) -> None:
+        """Load the latest stats for several formats concurrently, off the event loop."""
+        await asyncio.gather(*(self.get_stats_async(fmt, rating) for fmt in dict.fromkeys(formats)))
+
     def get_pokemon(
         self, pokemon_name: str, format_id: str, rating: int = 1825
     ) -> PokemonUsageData | None:
         """Get usage data for a specific Pokemon."""
         stats = self.get_stats(format_id, rating)
-        key = pokemon_name.lower().replace(" ", "").replace("-", "")
+        key = _normalize(pokemon_name)
         return stats.get(key)
 
     def get_top_pokemon(
@@ -323,8 +587,7 @@ class SmogonStatsLoader:
     ) -> list[PokemonUsageData]:
         """Get the top N Pokemon by raw count."""
         stats = self.get_stats(format_id, rating)
-        sorted_pokemon = sorted(stats.values(), key=lambda p: p.raw_count, reverse=True)
-        return sorted_pokemon[:top_n]
+        return heapq.nlargest(top_n, stats.values(), key=attrgetter("raw_count"))
 
     def get_counters(
         self, pokemon_name: str, format_id: str, rating: int = 1825
@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+
+from functools import partial
+
+import pytest
+from mcpkmn_showdown import pokemon_server
+from mcpkmn_showdown.data_loader import PokemonDataLoader, get_loader
+from mcpkmn_showdown.smogon_stats import get_stats_loader
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """A fully loaded data loader shared by read-only tests.
+
+    Test classes that need a fresh, unloaded loader define their own
+    ``loader`` fixture, which takes precedence over this one.
+    """
+    loader = PokemonDataLoader()
+    loader.load_all()
+    return loader
+
+
+@pytest.fixture(scope="session")
+def tools():
+    """Tool handlers pre-bound to the warmed global loaders, keyed by tool name.
+
+    Lets tests await a handler directly with just its arguments, skipping the
+    call_tool dispatch, which test_all_tools_return_text_content still covers.
+    """
+    pokemon_server._preload()
+    loader, stats_loader = get_loader(), get_stats_loader()
+    return {
+        name: partial(handler, loader, stats_loader)
+        for name, handler in pokemon_server._HANDLERS.items()
+    }
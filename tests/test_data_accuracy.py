@@ -9,13 +9,11 @@ This is the core claim: structured tools beat LLM memory for precise data.
 """
 
 import pytest
-from mcpkmn_showdown.data_loader import PokemonDataLoader
 
 
-@pytest.fixture
-def loader():
-    """Create a data loader for tests."""
-    return PokemonDataLoader()
+def _cases(table: dict) -> tuple:
+    """Freeze a name -> expected table into parametrize cases identified by name."""
+    return tuple(pytest.param(name, expected, id=name) for name, expected in table.items())
 
 
 # ============================================================================
@@ -30,10 +28,6 @@ class TestPokemonBaseStats:
     is the example from the LinkedIn post — models often guess 98, 100, or 105.
     """
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
     # Canonical base stats: {pokemon: {stat: value}}
     # Source: Pokemon Showdown / Bulbapedia
     CANONICAL_STATS = {
@@ -87,7 +81,7 @@ class TestPokemonBaseStats:
         },
     }
 
-    @pytest.mark.parametrize("pokemon_name,expected_stats", list(CANONICAL_STATS.items()))
+    @pytest.mark.parametrize("pokemon_name,expected_stats", _cases(CANONICAL_STATS))
     def test_base_stats_exact(self, loader, pokemon_name, expected_stats):
         """Verify each Pokemon's base stats are exactly correct."""
         poke = loader.get_pokemon(pokemon_name)
@@ -102,10 +96,6 @@ class TestPokemonBaseStats:
 class TestPokemonTypes:
     """Verify Pokemon type assignments are correct."""
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
     CANONICAL_TYPES = {
         "garchomp": ["Dragon", "Ground"],
         "pikachu": ["Electric"],
@@ -121,7 +111,7 @@ class TestPokemonTypes:
         "toxapex": ["Poison", "Water"],
     }
 
-    @pytest.mark.parametrize("pokemon_name,expected_types", list(CANONICAL_TYPES.items()))
+    @pytest.mark.parametrize("pokemon_name,expected_types", _cases(CANONICAL_TYPES))
     def test_types_exact(self, loader, pokemon_name, expected_types):
         """Verify each Pokemon's types are exactly correct."""
         poke = loader.get_pokemon(pokemon_name)
@@ -143,10 +133,6 @@ class TestTypeChartAccuracy:
     has 18x18 = 324 matchups (plus immunities, double types, etc.).
     """
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
     def test_all_18_types_present(self, loader):
         """Verify all 18 standard types exist in the chart."""
         loader.load_all()
@@ -171,12 +157,6 @@ class TestTypeChartAccuracy:
         ("dragon", ["fairy"], 0.0),
     ]
 
-    @pytest.mark.parametrize("atk,def_types,expected", IMMUNITIES)
-    def test_immunities(self, loader, atk, def_types, expected):
-        """Verify all type immunities return 0x."""
-        result = loader.get_type_effectiveness(atk, def_types)
-        assert result == expected, f"{atk} vs {def_types}: got {result}x, expected {expected}x"
-
     # === Super effective (2x) ===
 
     SUPER_EFFECTIVE = [
@@ -233,12 +213,6 @@ class TestTypeChartAccuracy:
         ("poison", ["fairy"], 2.0),
     ]
 
-    @pytest.mark.parametrize("atk,def_types,expected", SUPER_EFFECTIVE)
-    def test_super_effective(self, loader, atk, def_types, expected):
-        """Verify all super effective matchups return 2x."""
-        result = loader.get_type_effectiveness(atk, def_types)
-        assert result == expected, f"{atk} vs {def_types}: got {result}x, expected {expected}x"
-
     # === Double super effective (4x) - dual type weaknesses ===
 
     DOUBLE_SUPER_EFFECTIVE = [
@@ -254,12 +228,6 @@ class TestTypeChartAccuracy:
         ("fire", ["grass", "bug"], 4.0),           # Parasect
     ]
 
-    @pytest.mark.parametrize("atk,def_types,expected", DOUBLE_SUPER_EFFECTIVE)
-    def test_double_super_effective(self, loader, atk, def_types, expected):
-        """Verify 4x weaknesses on dual-typed Pokemon."""
-        result = loader.get_type_effectiveness(atk, def_types)
-        assert result == expected, f"{atk} vs {def_types}: got {result}x, expected {expected}x"
-
     # === Not very effective (0.5x) ===
 
     NOT_VERY_EFFECTIVE = [
@@ -297,12 +265,6 @@ class TestTypeChartAccuracy:
         ("poison", ["ghost"], 0.5),
     ]
 
-    @pytest.mark.parametrize("atk,def_types,expected", NOT_VERY_EFFECTIVE)
-    def test_not_very_effective(self, loader, atk, def_types, expected):
-        """Verify all not-very-effective matchups return 0.5x."""
-        result = loader.get_type_effectiveness(atk, def_types)
-        assert result == expected, f"{atk} vs {def_types}: got {result}x, expected {expected}x"
-
     # === Double resistance (0.25x) ===
 
     DOUBLE_RESIST = [
@@ -312,11 +274,79 @@ class TestTypeChartAccuracy:
         ("bug", ["fire", "flying"], 0.25),     # Both resist Bug
     ]
 
-    @pytest.mark.parametrize("atk,def_types,expected", DOUBLE_RESIST)
-    def test_double_resistance(self, loader, atk, def_types, expected):
-        """Verify 0.25x resistances on dual types."""
-        result = loader.get_type_effectiveness(atk, def_types)
-        assert result == expected, f"{atk} vs {def_types}: got {result}x, expected {expected}x"
+    ALL_MATCHUPS = (
+        IMMUNITIES + SUPER_EFFECTIVE + DOUBLE_SUPER_EFFECTIVE
+        + NOT_VERY_EFFECTIVE + DOUBLE_RESIST
+    )
+
+    # === Full 18x18 chart (Gen 6+) - every pair not listed is 1x ===
+
+    TYPES = (
+        "normal", "fire", "water", "electric", "grass", "ice",
+        "fighting", "poison", "ground", "flying", "psychic", "bug",
+        "rock", "ghost", "dragon", "dark", "steel", "fairy",
+    )
+
+    CHART = {
+        "normal": {"rock": 0.5, "steel": 0.5, "ghost": 0.0},
+        "fire": {"grass": 2.0, "ice": 2.0, "bug": 2.0, "steel": 2.0,
+                 "fire": 0.5, "water": 0.5, "rock": 0.5, "dragon": 0.5},
+        "water": {"fire": 2.0, "ground": 2.0, "rock": 2.0,
+                  "water": 0.5, "grass": 0.5, "dragon": 0.5},
+        "electric": {"water": 2.0, "flying": 2.0,
+                     "electric": 0.5, "grass": 0.5, "dragon": 0.5, "ground": 0.0},
+        "grass": {"water": 2.0, "ground": 2.0, "rock": 2.0,
+                  "fire": 0.5, "grass": 0.5, "poison": 0.5, "flying": 0.5,
+                  "bug": 0.5, "dragon": 0.5, "steel": 0.5},
+        "ice": {"grass": 2.0, "ground": 2.0, "flying": 2.0, "dragon": 2.0,
+                "fire": 0.5, "water": 0.5, "ice": 0.5, "steel": 0.5},
+        "fighting": {"normal": 2.0, "ice": 2.0, "rock": 2.0, "dark": 2.0, "steel": 2.0,
+                     "poison": 0.5, "flying": 0.5, "psychic": 0.5, "bug": 0.5,
+                     "fairy": 0.5, "ghost": 0.0},
+        "poison": {"grass": 2.0, "fairy": 2.0,
+                   "poison": 0.5, "ground": 0.5, "rock": 0.5, "ghost": 0.5, "steel": 0.0},
+        "ground": {"fire": 2.0, "electric": 2.0, "poison": 2.0, "rock": 2.0, "steel": 2.0,
+                   "grass": 0.5, "bug": 0.5, "flying": 0.0},
+        "flying": {"grass": 2.0, "fighting": 2.0, "bug": 2.0,
+                   "electric": 0.5, "rock": 0.5, "steel": 0.5},
+        "psychic": {"fighting": 2.0, "poison": 2.0,
+                    "psychic": 0.5, "steel": 0.5, "dark": 0.0},
+        "bug": {"grass": 2.0, "psychic": 2.0, "dark": 2.0,
+                "fire": 0.5, "fighting": 0.5, "poison": 0.5, "flying": 0.5,
+                "ghost": 0.5, "steel": 0.5, "fairy": 0.5},
+        "rock": {"fire": 2.0, "ice": 2.0, "flying": 2.0, "bug": 2.0,
+                 "fighting": 0.5, "ground": 0.5, "steel": 0.5},
+        "ghost": {"psychic": 2.0, "ghost": 2.0, "dark": 0.5, "normal": 0.0},
+        "dragon": {"dragon": 2.0, "steel": 0.5, "fairy": 0.0},
+        "dark": {"psychic": 2.0, "ghost": 2.0,
+                 "fighting": 0.5, "dark": 0.5, "fairy": 0.5},
+        "steel": {"ice": 2.0, "rock": 2.0, "fairy": 2.0,
+                  "fire": 0.5, "water": 0.5, "electric": 0.5, "steel": 0.5},
+        "fairy": {"fighting": 2.0, "dragon": 2.0, "dark": 2.0,
+                  "fire": 0.5, "poison": 0.5, "steel": 0.5},
+    }
+
+    def test_full_type_chart(self, loader):
+        """Verify all 324 single-type matchups against the canonical chart in one bulk call."""
+        pairs = [(atk, dfn) for atk in self.TYPES for dfn in self.TYPES]
+        actual = loader.bulk_type_effectiveness(
+            [atk for atk, _ in pairs], [[dfn] for _, dfn in pairs]
+        )
+        mismatches = [
+            f"{atk} vs {dfn}: got {result}x, expected {self.CHART[atk].get(dfn, 1.0)}x"
+            for (atk, dfn), result in zip(pairs, actual)
+            if result != self.CHART[atk].get(dfn, 1.0)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    def test_type_chart_matchups(self, loader):
+        """Verify every tabled matchup, reporting all mismatches together."""
+        mismatches = []
+        for atk, def_types, expected in self.ALL_MATCHUPS:
+            result = loader.get_type_effectiveness(atk, def_types)
+            if result != expected:
+                mismatches.append(f"{atk} vs {def_types}: got {result}x, expected {expected}x")
+        assert not mismatches, "\n".join(mismatches)
 
 
 # ============================================================================
@@ -326,10 +356,6 @@ class TestTypeChartAccuracy:
 class TestMoveDataAccuracy:
     """Verify exact move data for well-known competitive moves."""
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
     CANONICAL_MOVES = {
         "earthquake": {
             "basePower": 100, "type": "Ground", "category": "Physical",
@@ -375,7 +401,7 @@ class TestMoveDataAccuracy:
         },
     }
 
-    @pytest.mark.parametrize("move_name,expected", list(CANONICAL_MOVES.items()))
+    @pytest.mark.parametrize("move_name,expected", _cases(CANONICAL_MOVES))
     def test_move_data_exact(self, loader, move_name, expected):
         """Verify each move's data is exactly correct."""
         move = loader.get_move(move_name)
@@ -389,10 +415,6 @@ class TestMoveDataAccuracy:
 class TestPriorityMoveAccuracy:
     """Verify priority move values are correct."""
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
     PRIORITY_MOVES = {
         "extremespeed": 2,
         "aquajet": 1,
@@ -407,7 +429,7 @@ class TestPriorityMoveAccuracy:
         "detect": 4,
     }
 
-    @pytest.mark.parametrize("move_name,expected_priority", list(PRIORITY_MOVES.items()))
+    @pytest.mark.parametrize("move_name,expected_priority", _cases(PRIORITY_MOVES))
     def test_priority_values(self, loader, move_name, expected_priority):
         """Verify priority move priority values."""
         move = loader.get_move(move_name)
@@ -424,17 +446,13 @@ class TestPriorityMoveAccuracy:
 class TestAbilityDataAccuracy:
     """Verify ability lookup returns meaningful descriptions."""
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
-    ABILITIES_EXIST = [
+    ABILITIES_EXIST = (
         "intimidate", "levitate", "flashfire", "drizzle", "drought",
         "sandstream", "snowwarning", "multiscale", "hugepower",
         "protean", "regenerator", "magicguard", "technician",
         "adaptability", "wonderguard", "prankster", "unaware",
         "magicbounce", "moldbreaker", "contrary", "speedboost",
-    ]
+    )
 
     @pytest.mark.parametrize("ability_name", ABILITIES_EXIST)
     def test_ability_exists_with_description(self, loader, ability_name):
@@ -454,15 +472,11 @@ class TestAbilityDataAccuracy:
 class TestItemDataAccuracy:
     """Verify item lookup returns correct data."""
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
-    ITEMS_EXIST = [
+    ITEMS_EXIST = (
         "choicescarf", "choiceband", "choicespecs", "leftovers",
         "lifeorb", "focussash", "heavydutyboots", "assaultvest",
         "rockyhelmet", "eviolite", "shedshell",
-    ]
+    )
 
     @pytest.mark.parametrize("item_name", ITEMS_EXIST)
     def test_item_exists_with_description(self, loader, item_name):
@@ -481,12 +495,6 @@ class TestItemDataAccuracy:
 class TestDataCompleteness:
     """Verify the dataset is sufficiently complete for competitive use."""
 
-    @pytest.fixture
-    def loader(self):
-        loader = PokemonDataLoader()
-        loader.load_all()
-        return loader
-
     def test_minimum_pokemon_count(self, loader):
         """Verify we have enough Pokemon (1000+ expected for Gen 9)."""
         assert len(loader.pokemon) >= 1000, (
@@ -518,14 +526,12 @@ class TestDataCompleteness:
             "fire", "flying", "ghost", "grass", "ground", "ice",
             "normal", "poison", "psychic", "rock", "steel", "water",
         }
+        missing_types = standard_types - loader.typechart.keys()
+        assert not missing_types, f"Types missing from chart: {sorted(missing_types)}"
         for type_name in standard_types:
-            assert type_name in loader.typechart, f"Type {type_name} missing from chart"
-            type_data = loader.typechart[type_name]
             # Each type should have matchup data against all 18 types
-            for atk_type in standard_types:
-                assert atk_type in type_data, (
-                    f"Type chart missing {atk_type} vs {type_name}"
-                )
+            missing = standard_types - loader.typechart[type_name].keys()
+            assert not missing, f"Type chart missing {sorted(missing)} vs {type_name}"
 
     def test_all_gen9_ou_staples_exist(self, loader):
         """Verify all Gen 9 OU staple Pokemon are in the database."""
@@ -543,24 +549,37 @@ class TestDataCompleteness:
         required_fields = {"name", "types", "baseStats"}
         required_stats = {"hp", "atk", "def", "spa", "spd", "spe"}
 
+        # Collect every offender so one failure reports them all
+        missing = []
         for poke_id, poke_data in loader.pokemon.items():
             # Cosmetic formes (e.g. Burmy-Sandy) inherit data from base species
             if poke_data.get("isCosmeticForme"):
                 continue
-            for field in required_fields:
-                assert field in poke_data, f"{poke_id} missing field '{field}'"
-            stats = poke_data.get("baseStats", {})
-            for stat in required_stats:
-                assert stat in stats, f"{poke_id} missing stat '{stat}'"
+            absent = (required_fields - poke_data.keys()) | (
+                required_stats - poke_data.get("baseStats", {}).keys()
+            )
+            if absent:
+                missing.append((poke_id, sorted(absent)))
+        assert not missing, missing
 
     def test_all_moves_have_required_fields(self, loader):
         """Verify all move entries have minimum required fields."""
-        for move_id, move_data in loader.moves.items():
-            assert "type" in move_data, f"Move {move_id} missing 'type'"
-            assert "category" in move_data, f"Move {move_id} missing 'category'"
-            assert move_data["category"] in {"Physical", "Special", "Status"}, (
-                f"Move {move_id} has invalid category: {move_data['category']}"
-            )
+        required_fields = {"type", "category"}
+        categories = {"Physical", "Special", "Status"}
+
+        missing_fields = [
+            (move_id, sorted(required_fields - move_data.keys()))
+            for move_id, move_data in loader.moves.items()
+            if not required_fields.issubset(move_data)
+        ]
+        assert not missing_fields, missing_fields
+
+        bad_categories = [
+            (move_id, move_data["category"])
+            for move_id, move_data in loader.moves.items()
+            if move_data["category"] not in categories
+        ]
+        assert not bad_categories, bad_categories
 
 
 # ============================================================================
@@ -570,10 +589,6 @@ class TestDataCompleteness:
 class TestNameNormalizationComprehensive:
     """Test that various name formats all resolve correctly."""
 
-    @pytest.fixture
-    def loader(self):
-        return PokemonDataLoader()
-
     def test_mega_charizard_x(self, loader):
         poke = loader.get_pokemon("Mega Charizard X")
         assert poke is not None
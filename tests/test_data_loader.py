@@ -1,6 +1,9 @@
 """Tests for the data loader module."""
 
+import shutil
+
 import pytest
+from mcpkmn_showdown import data_loader
 from mcpkmn_showdown.data_loader import PokemonDataLoader, get_loader
 
 
@@ -28,6 +31,25 @@ class TestPokemonDataLoader:
         loader.load_all()
         assert loader.pokemon is first_pokemon
 
+    def test_load_all_returns_early_once_loaded(self, loader, monkeypatch):
+        """Test that a repeat load_all does not start another thread pool."""
+        loader.load_all()
+        monkeypatch.setattr(data_loader, "ThreadPoolExecutor", None)
+        loader.load_all()
+
+    def test_load_all_builds_indexes(self, loader):
+        """Test that load_all warms the ability and move indexes."""
+        loader.load_all()
+        assert loader._ability_index is not None
+        assert loader._indexed_moves
+
+    def test_get_move_loads_only_moves(self, loader):
+        """Test that lookups only load the dataset they need."""
+        assert loader.get_move("earthquake") is not None
+        assert len(loader.moves) > 0
+        assert loader.pokemon == {}
+        assert loader.abilities == {}
+
     def test_get_pokemon_basic(self, loader):
         """Test basic Pokemon lookup."""
         poke = loader.get_pokemon("pikachu")
@@ -105,6 +127,26 @@ class TestPokemonDataLoader:
         mult = loader.get_type_effectiveness("normal", ["normal"])
         assert mult == 1.0
 
+    def test_type_effectiveness_accepts_any_sequence(self, loader):
+        """Test that list and tuple defenders share the memoized result."""
+        first = loader.get_type_effectiveness("Electric", ["Water", "Flying"])
+        again = loader.get_type_effectiveness("Electric", ("Water", "Flying"))
+        assert first == again == 4.0
+        assert loader._cached_effectiveness.cache_info().hits >= 1
+
+    def test_bulk_type_effectiveness(self, loader):
+        """Test bulk calculation matches the single-matchup path."""
+        attack_types = ["electric", "Ground", "fire", "normal", "sandstorm", "powder"]
+        defenders = [
+            ["water", "flying"], ["Flying"], ["fire", "water"], ["ghost"], ["rock"], ["Grass"],
+        ]
+        expected = [
+            loader.get_type_effectiveness(atk, defs)
+            for atk, defs in zip(attack_types, defenders)
+        ]
+        assert loader.bulk_type_effectiveness(attack_types, defenders) == expected
+        assert expected == [4.0, 0.0, 0.25, 0.0, 0.0, 0.0]
+
     def test_get_pokemon_with_ability(self, loader):
         """Test finding Pokemon by ability."""
         pokemon = loader.get_pokemon_with_ability("Intimidate")
@@ -112,6 +154,13 @@ class TestPokemonDataLoader:
         # Gyarados is a well-known Intimidate user
         assert any("Gyarados" in name for name in pokemon)
 
+    def test_get_pokemon_with_ability_normalizes_name(self, loader):
+        """Test ability lookup ignores case and separators, and sorts names."""
+        pokemon = loader.get_pokemon_with_ability("flash-fire")
+        assert pokemon == loader.get_pokemon_with_ability("Flash Fire")
+        assert pokemon == sorted(pokemon)
+        assert "Heatran" in pokemon
+
     def test_search_moves_by_priority(self, loader):
         """Test searching for priority moves."""
         moves = loader.search_moves_by_priority(min_priority=1)
@@ -120,6 +169,42 @@ class TestPokemonDataLoader:
         move_names = [m["name"] for m in moves]
         assert "Quick Attack" in move_names
 
+    def test_search_move_ids_by_type(self, loader):
+        """Test id-only type search matches the full search."""
+        ids = loader.search_move_ids_by_type("Fire")
+        assert ids == tuple(m["id"] for m in loader.search_moves_by_type("fire"))
+        assert "flamethrower" in ids
+
+
+class TestPickleCache:
+    """Tests for the optional pickle sidecar cache."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        shutil.copy(data_loader.CACHE_DIR / "typechart.json", tmp_path)
+        monkeypatch.setattr(data_loader, "CACHE_DIR", tmp_path)
+        return tmp_path
+
+    def test_disabled_by_default(self, cache_dir, monkeypatch):
+        """Test that no sidecar is written unless the env var is set."""
+        monkeypatch.delenv(data_loader.PICKLE_CACHE_ENV, raising=False)
+        PokemonDataLoader()._load_json("typechart.json")
+        assert not (cache_dir / "typechart.pkl").exists()
+
+    def test_sidecar_round_trip(self, cache_dir, monkeypatch):
+        """Test that the sidecar is written once and matches the JSON data."""
+        monkeypatch.setenv(data_loader.PICKLE_CACHE_ENV, "1")
+        first = PokemonDataLoader()._load_json("typechart.json")
+        assert (cache_dir / "typechart.pkl").exists()
+        second = PokemonDataLoader()._load_json("typechart.json")
+        assert first == second
+        assert second["ground"]["electric"] == 0.0
+
+    def test_empty_file_loads_as_empty_dict(self, cache_dir):
+        """Test that an empty cache file parses to {} instead of raising."""
+        (cache_dir / "items.json").write_bytes(b"")
+        assert PokemonDataLoader()._load_json("items.json") == {}
+
 
 class TestGlobalLoader:
     """Tests for the global loader singleton."""
@@ -195,12 +280,36 @@ class TestSearchPokemonByStat:
             assert "Dragon" in poke["types"]
             assert poke["baseStats"]["atk"] >= 100
 
+    def test_type_bits_fixed_when_pokedex_loads(self, loader):
+        """Test that every type gets a distinct bit before any stat index is built."""
+        loader._ensure_pokemon()
+        bits = loader._type_bits
+        assert {"dragon", "fairy", "steel"} <= bits.keys()
+        assert len(set(bits.values())) == len(bits)
+        loader.search_pokemon_by_stat("spe", min_value=100, types=["Ghost"])
+        assert loader._type_bits is bits
+
     def test_search_stat_aliases(self, loader):
         """Test that stat aliases work."""
         r1 = loader.search_pokemon_by_stat("speed", min_value=150)
         r2 = loader.search_pokemon_by_stat("spe", min_value=150)
         assert len(r1) == len(r2)
 
+    def test_repeat_search_returns_fresh_list(self, loader):
+        """Test that cached searches hand out independent lists."""
+        r1 = loader.search_pokemon_by_stat("spe", min_value=150, types=["Electric"])
+        r1.clear()
+        r2 = loader.search_pokemon_by_stat("Speed", min_value=150, types=("electric",))
+        assert len(r2) > 0
+
+    def test_repeat_search_shares_result_dicts(self, loader):
+        """Test that result dicts are shared, read-only, across identical searches."""
+        r1 = loader.search_pokemon_by_stat("spe", min_value=150)
+        r2 = loader.search_pokemon_by_stat("spe", min_value=150)
+        assert r1 is not r2
+        assert all(a is b for a, b in zip(r1, r2))
+        assert r1[0]["baseStats"] is loader.pokemon[r1[0]["id"]]["baseStats"]
+
 
 class TestSearchMovesByEffect:
     """Tests for searching moves by strategic effect."""
@@ -248,6 +357,17 @@ class TestSearchMovesByEffect:
         for move in results:
             assert move.get("type", "").lower() == "ground"
 
+    def test_search_move_ids_by_effect(self, loader):
+        """Test id-only effect search matches the full search."""
+        ids = loader.search_move_ids_by_effect("pivot")
+        assert ids == tuple(m["id"] for m in loader.search_moves_by_effect("pivot"))
+        assert "uturn" in ids
+
+    def test_search_returns_loader_move_dicts(self, loader):
+        """Test that effect search hands out the loader's own, read-only move dicts."""
+        results = loader.search_moves_by_effect("pivot")
+        assert all(move is loader.moves[move["id"]] for move in results)
+
     def test_search_invalid_effect(self, loader):
         """Test that invalid effect returns empty."""
         results = loader.search_moves_by_effect("nonexistent")
@@ -2,13 +2,28 @@
 Integration tests for the MCP server tool handlers.
 
 These tests exercise the actual tool call handlers end-to-end, verifying
-that each of the 15 MCP tools returns properly formatted TextContent responses.
+that each of the 16 MCP tools returns properly formatted TextContent responses.
 """
 
+import asyncio
+import re
+import threading
+from collections import OrderedDict
+
 import pytest
 from mcp.types import TextContent
 
+from mcpkmn_showdown import pokemon_server, smogon_stats
 from mcpkmn_showdown.pokemon_server import call_tool
+from mcpkmn_showdown.smogon_stats import PokemonUsageData, get_stats_loader
+
+
+def assert_all_in(text: str, *tokens: str) -> None:
+    """Assert every token occurs in text, listing all missing tokens at once."""
+    found = set(re.findall("|".join(map(re.escape, tokens)), text))
+    # findall skips tokens overlapped by an earlier match; confirm those directly
+    missing = [token for token in tokens if token not in found and token not in text]
+    assert not missing, f"missing {missing} in:\n{text}"
 
 
 # ============================================================================
@@ -19,85 +34,75 @@ class TestGetPokemonTool:
     """Integration tests for the get_pokemon tool."""
 
     @pytest.mark.asyncio
-    async def test_valid_pokemon(self):
-        result = await call_tool("get_pokemon", {"name": "garchomp"})
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-        text = result[0].text
-        assert "Garchomp" in text
-        assert "Dragon" in text
-        assert "Ground" in text
-        assert "102" in text  # base speed
-        assert "130" in text  # base attack
+    async def test_lookups(self, tools):
+        # Independent lookups share one event loop turn
+        garchomp, missing, pikachu, blissey, greninja = await asyncio.gather(
+            tools["get_pokemon"]({"name": "garchomp"}),
+            tools["get_pokemon"]({"name": "notapokemon"}),
+            tools["get_pokemon"]({"name": "PIKACHU"}),
+            tools["get_pokemon"]({"name": "blissey"}),
+            tools["get_pokemon"]({"name": "greninja"}),
+        )
+
+        assert len(garchomp) == 1
+        assert isinstance(garchomp[0], TextContent)
+        text = garchomp[0].text
+        # 102 base speed, 130 base attack
+        assert_all_in(text, "Garchomp", "Dragon", "Ground", "102", "130", "Abilities")
+        # Garchomp has Sand Veil and Rough Skin
+        assert "Sand Veil" in text or "Rough Skin" in text
 
-    @pytest.mark.asyncio
-    async def test_invalid_pokemon(self):
-        result = await call_tool("get_pokemon", {"name": "notapokemon"})
-        assert len(result) == 1
-        assert "not found" in result[0].text
+        assert len(missing) == 1
+        assert "not found" in missing[0].text
 
-    @pytest.mark.asyncio
-    async def test_pokemon_case_insensitive(self):
-        result = await call_tool("get_pokemon", {"name": "PIKACHU"})
-        assert "Pikachu" in result[0].text
+        # Case-insensitive
+        assert "Pikachu" in pikachu[0].text
 
-    @pytest.mark.asyncio
-    async def test_pokemon_includes_abilities(self):
-        result = await call_tool("get_pokemon", {"name": "garchomp"})
-        text = result[0].text
-        assert "Abilities" in text
-        # Garchomp has Sand Veil and Rough Skin
-        assert "Sand Veil" in text or "Rough Skin" in text
+        # All six stats are listed
+        assert_all_in(blissey[0].text, "HP: 255", "Defense: 10")
+
+        # Special ability slot
+        assert_all_in(greninja[0].text, "Battle Bond (Special)", "Protean (Hidden)")
 
     @pytest.mark.asyncio
-    async def test_pokemon_includes_all_stats(self):
-        result = await call_tool("get_pokemon", {"name": "blissey"})
-        text = result[0].text
-        assert "HP: 255" in text
-        assert "Defense: 10" in text
+    async def test_repeat_lookup_matches_first(self, tools):
+        first = await tools["get_pokemon"]({"name": "dragapult"})
+        second = await tools["get_pokemon"]({"name": "dragapult"})
+        assert first[0].text == second[0].text
 
 
 class TestGetMoveTool:
     """Integration tests for the get_move tool."""
 
     @pytest.mark.asyncio
-    async def test_valid_move(self):
-        result = await call_tool("get_move", {"name": "earthquake"})
-        assert len(result) == 1
-        text = result[0].text
-        assert "Earthquake" in text
-        assert "Ground" in text
-        assert "Physical" in text
-        assert "100" in text  # base power
+    async def test_lookups(self, tools):
+        earthquake, missing, swords_dance, extreme_speed, thunderbolt, flare_blitz = (
+            await asyncio.gather(
+                tools["get_move"]({"name": "earthquake"}),
+                tools["get_move"]({"name": "notamove"}),
+                tools["get_move"]({"name": "swords dance"}),
+                tools["get_move"]({"name": "extreme speed"}),
+                tools["get_move"]({"name": "thunderbolt"}),
+                tools["get_move"]({"name": "flare blitz"}),
+            )
+        )
 
-    @pytest.mark.asyncio
-    async def test_invalid_move(self):
-        result = await call_tool("get_move", {"name": "notamove"})
-        assert "not found" in result[0].text
+        assert len(earthquake) == 1
+        text = earthquake[0].text
+        assert_all_in(text, "Earthquake", "Ground", "Physical", "100")  # 100 base power
 
-    @pytest.mark.asyncio
-    async def test_status_move(self):
-        result = await call_tool("get_move", {"name": "swords dance"})
-        text = result[0].text
-        assert "Status" in text
+        assert "not found" in missing[0].text
 
-    @pytest.mark.asyncio
-    async def test_priority_move_shows_priority(self):
-        result = await call_tool("get_move", {"name": "extreme speed"})
-        text = result[0].text
+        assert "Status" in swords_dance[0].text
+
+        text = extreme_speed[0].text
         assert "+2" in text or "Priority" in text
 
-    @pytest.mark.asyncio
-    async def test_move_with_secondary_effect(self):
-        result = await call_tool("get_move", {"name": "thunderbolt"})
-        text = result[0].text
         # Thunderbolt has 10% paralysis chance
-        assert "10%" in text or "PAR" in text or "paralyz" in text.lower()
+        text = thunderbolt[0].text
+        assert re.search(r"10%|PAR|(?i:paralyz)", text)
 
-    @pytest.mark.asyncio
-    async def test_move_with_recoil(self):
-        result = await call_tool("get_move", {"name": "flare blitz"})
-        text = result[0].text
+        text = flare_blitz[0].text
         assert "Recoil" in text or "recoil" in text
 
 
@@ -105,34 +110,36 @@ class TestGetAbilityTool:
     """Integration tests for the get_ability tool."""
 
     @pytest.mark.asyncio
-    async def test_valid_ability(self):
-        result = await call_tool("get_ability", {"name": "intimidate"})
-        assert len(result) == 1
-        text = result[0].text
+    async def test_lookups(self, tools):
+        intimidate, missing = await asyncio.gather(
+            tools["get_ability"]({"name": "intimidate"}),
+            tools["get_ability"]({"name": "notanability"}),
+        )
+
+        assert len(intimidate) == 1
+        text = intimidate[0].text
         assert "Intimidate" in text
         assert "Attack" in text  # description should mention Attack
 
-    @pytest.mark.asyncio
-    async def test_invalid_ability(self):
-        result = await call_tool("get_ability", {"name": "notanability"})
-        assert "not found" in result[0].text
+        assert "not found" in missing[0].text
 
 
 class TestGetItemTool:
     """Integration tests for the get_item tool."""
 
     @pytest.mark.asyncio
-    async def test_valid_item(self):
-        result = await call_tool("get_item", {"name": "choice scarf"})
-        assert len(result) == 1
-        text = result[0].text
+    async def test_lookups(self, tools):
+        choice_scarf, missing = await asyncio.gather(
+            tools["get_item"]({"name": "choice scarf"}),
+            tools["get_item"]({"name": "notanitem"}),
+        )
+
+        assert len(choice_scarf) == 1
+        text = choice_scarf[0].text
         assert "Choice Scarf" in text
         assert "Speed" in text or "speed" in text
 
-    @pytest.mark.asyncio
-    async def test_invalid_item(self):
-        result = await call_tool("get_item", {"name": "notanitem"})
-        assert "not found" in result[0].text
+        assert "not found" in missing[0].text
 
 
 class TestGetTypeEffectivenessTool:
@@ -177,6 +184,34 @@ class TestGetTypeEffectivenessTool:
         assert "1x" in text or "1.0" in text
 
 
+class TestGetTypeMatchupsTool:
+    """Integration tests for the get_type_matchups tool."""
+
+    @pytest.mark.asyncio
+    async def test_multiple_defenders(self):
+        result = await call_tool("get_type_matchups", {
+            "attack_type": "ground",
+            "defenders": [["fire", "steel"], ["water", "flying"], ["electric"]],
+        })
+        lines = result[0].text.splitlines()
+        assert "## Ground Type Matchups" in lines[0]
+        assert lines[2].startswith("- **Fire/Steel**: 4.0x")
+        assert lines[3].startswith("- **Water/Flying**: 0.0x")
+        assert lines[4].startswith("- **Electric**: 2.0x")
+
+    @pytest.mark.asyncio
+    async def test_no_defenders(self):
+        result = await call_tool("get_type_matchups", {"attack_type": "fire", "defenders": []})
+        assert "No defenders" in result[0].text
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("defenders", [["water", "flying"], [["water"], []], [["fire", 3]]])
+    async def test_malformed_defenders(self, defenders):
+        result = await call_tool("get_type_matchups", {"attack_type": "fire", "defenders": defenders})
+        assert result[0].text.startswith("Invalid defender")
+        assert "W/A/T/E/R" not in result[0].text
+
+
 # ============================================================================
 # Search Tools
 # ============================================================================
@@ -222,16 +257,13 @@ class TestListDangerousAbilitiesTool:
     async def test_all_categories(self):
         result = await call_tool("list_dangerous_abilities", {})
         text = result[0].text
-        assert "Immunity" in text
-        assert "Levitate" in text
-        assert "Huge Power" in text
+        assert_all_in(text, "Immunity", "Levitate", "Huge Power")
 
     @pytest.mark.asyncio
     async def test_specific_category(self):
         result = await call_tool("list_dangerous_abilities", {"category": "immunity"})
         text = result[0].text
-        assert "Levitate" in text
-        assert "Wonder Guard" in text
+        assert_all_in(text, "Levitate", "Wonder Guard")
 
     @pytest.mark.asyncio
     async def test_invalid_category(self):
@@ -349,6 +381,103 @@ class TestGetFormatInfoTool:
         assert "gen9ou" in text  # should suggest available formats
 
 
+class TestSmogonResponseCache:
+    """Rendered Smogon responses are reused, but failed lookups are not."""
+
+    @pytest.fixture
+    def stats_loader(self):
+        pokemon_server._invalidate_smogon_caches()
+        loader = get_stats_loader()
+        yield loader
+        pokemon_server._invalidate_smogon_caches()
+
+    @pytest.mark.asyncio
+    async def test_success_is_cached_and_failure_is_not(self, stats_loader, monkeypatch):
+        calls = []
+
+        def fake_top(format_id, top_n=20, rating=1825):
+            calls.append(format_id)
+            if format_id == "gen9empty":
+                return []
+            return [PokemonUsageData(name="Great Tusk", raw_count=100, moves={"Rapid Spin": 90.0})]
+
+        monkeypatch.setattr(stats_loader, "get_top_pokemon", fake_top)
+
+        first = await call_tool("get_smogon_usage", {"format": "gen9ou"})
+        second = await call_tool("get_smogon_usage", {"format": "gen9ou"})
+        assert first[0].text == second[0].text
+        assert "Great Tusk" in first[0].text
+
+        await call_tool("get_smogon_usage", {"format": "gen9empty"})
+        await call_tool("get_smogon_usage", {"format": "gen9empty"})
+        assert calls == ["gen9ou", "gen9empty", "gen9empty"]
+
+    @pytest.mark.asyncio
+    async def test_hits_keep_a_response_cached(self, stats_loader, monkeypatch):
+        calls = []
+
+        def fake_top(format_id, top_n=20, rating=1825):
+            calls.append(format_id)
+            return [PokemonUsageData(name="Great Tusk", raw_count=100)]
+
+        monkeypatch.setattr(stats_loader, "get_top_pokemon", fake_top)
+        monkeypatch.setattr(pokemon_server, "_SMOGON_RESPONSES_MAX", 2)
+
+        for format_id in ("gen9ou", "gen9uu", "gen9ou", "gen9ru", "gen9ou"):
+            await call_tool("get_smogon_usage", {"format": format_id})
+        assert calls == ["gen9ou", "gen9uu", "gen9ru"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_render_rechecks_latest_month(self, stats_loader, tmp_path, monkeypatch):
+        latest = smogon_stats._get_latest_month()
+        published = {smogon_stats._previous_month(latest): "Great Tusk"}
+
+        def fake_fetch(format_id, rating, year_month):
+            name = published.get(year_month)
+            if name is None:
+                return None
+            return f" +---+\n | {name} |\n +---+\n | Raw count: 10 |\n +---+\n"
+
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", fake_fetch)
+        monkeypatch.setattr(stats_loader, "_cache", OrderedDict())
+        monkeypatch.setattr(stats_loader, "_misses", {})
+        # Expire the loader's miss record and fallback renders immediately
+        monkeypatch.setattr(smogon_stats, "MISS_MAX_AGE_HOURS", 0)
+        monkeypatch.setattr(pokemon_server, "MISS_MAX_AGE_HOURS", 0)
+        args = {"format": "gen9fallbacktest"}
+
+        first = await call_tool("get_smogon_usage", args)
+        assert "Great Tusk" in first[0].text
+
+        published[latest] = "Iron Valiant"
+        second = await call_tool("get_smogon_usage", args)
+        assert "Iron Valiant" in second[0].text
+
+    def test_concurrent_clears_do_not_break_eviction(self, stats_loader, monkeypatch):
+        monkeypatch.setattr(pokemon_server, "_SMOGON_RESPONSES_MAX", 4)
+        stop = threading.Event()
+
+        def clear_repeatedly():
+            while not stop.is_set():
+                pokemon_server._invalidate_smogon_caches()
+
+        clearer = threading.Thread(target=clear_repeatedly)
+        clearer.start()
+        try:
+            for i in range(20000):
+                pokemon_server._remember_smogon_response(("usage", i), "text")
+                pokemon_server._cached_smogon_response(("usage", i - 1))
+        finally:
+            stop.set()
+            clearer.join()
+
+    def test_new_stats_drop_rendered_responses(self, stats_loader):
+        pokemon_server._remember_smogon_response(("usage", "gen9ou", 20, "2025-01"), "stale")
+        stats_loader.on_new_stats()
+        assert pokemon_server._SMOGON_RESPONSES == {}
+
+
 # ============================================================================
 # Unknown Tool
 # ============================================================================
@@ -361,6 +490,11 @@ class TestUnknownTool:
         result = await call_tool("not_a_real_tool", {})
         assert "Unknown tool" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_every_listed_tool_has_a_handler(self, tools):
+        listed = {tool.name for tool in await pokemon_server.list_tools()}
+        assert listed == set(tools)
+
 
 # ============================================================================
 # Response Format Validation
@@ -370,22 +504,22 @@ class TestResponseFormat:
     """Verify all tools return properly formatted markdown responses."""
 
     @pytest.mark.asyncio
-    async def test_pokemon_response_is_markdown(self):
-        result = await call_tool("get_pokemon", {"name": "garchomp"})
+    async def test_pokemon_response_is_markdown(self, tools):
+        result = await tools["get_pokemon"]({"name": "garchomp"})
         text = result[0].text
         assert "##" in text  # markdown heading
         assert "**" in text  # bold text
 
     @pytest.mark.asyncio
-    async def test_move_response_is_markdown(self):
-        result = await call_tool("get_move", {"name": "earthquake"})
+    async def test_move_response_is_markdown(self, tools):
+        result = await tools["get_move"]({"name": "earthquake"})
         text = result[0].text
         assert "##" in text
         assert "**Type:**" in text
 
     @pytest.mark.asyncio
-    async def test_type_effectiveness_response_is_markdown(self):
-        result = await call_tool("get_type_effectiveness", {
+    async def test_type_effectiveness_response_is_markdown(self, tools):
+        result = await tools["get_type_effectiveness"]({
             "attack_type": "fire",
             "defend_types": ["grass"],
         })
@@ -402,6 +536,7 @@ class TestResponseFormat:
             ("get_ability", {"name": "intimidate"}),
             ("get_item", {"name": "leftovers"}),
             ("get_type_effectiveness", {"attack_type": "fire", "defend_types": ["grass"]}),
+            ("get_type_matchups", {"attack_type": "fire", "defenders": [["grass"], ["water"]]}),
             ("search_priority_moves", {}),
             ("search_pokemon_by_ability", {"ability": "Intimidate"}),
             ("list_dangerous_abilities", {}),
@@ -409,8 +544,8 @@ class TestResponseFormat:
             ("search_moves_by_effect", {"effect": "pivot"}),
             ("get_format_info", {"format": "gen9ou"}),
         ]
-        for tool_name, args in tool_calls:
-            result = await call_tool(tool_name, args)
+        results = await asyncio.gather(*(call_tool(n, a) for n, a in tool_calls))
+        for (tool_name, _), result in zip(tool_calls, results):
             assert isinstance(result, list), f"{tool_name} didn't return a list"
             assert len(result) >= 1, f"{tool_name} returned empty list"
             assert isinstance(result[0], TextContent), (
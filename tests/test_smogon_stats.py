@@ -1,6 +1,10 @@
 """Tests for the Smogon stats fetcher and parser."""
 
+import os
+from dataclasses import asdict
+
 import pytest
+from mcpkmn_showdown import smogon_stats
 from mcpkmn_showdown.smogon_stats import (
     PokemonUsageData,
     SmogonStatsLoader,
@@ -8,6 +12,7 @@ from mcpkmn_showdown.smogon_stats import (
     _parse_section_entries,
     _parse_checks_and_counters,
     _parse_stats,
+    _previous_month,
 )
 
 
@@ -186,6 +191,27 @@ class TestParseStats:
         assert result["darkrai"].raw_count == 500000
 
 
+class TestPokemonUsageData:
+    def test_from_dict_round_trips_asdict(self):
+        original = _parse_pokemon_block(SAMPLE_BLOCK)
+        assert PokemonUsageData.from_dict(asdict(original)) == original
+
+    def test_from_dict_fills_defaults(self):
+        data = PokemonUsageData.from_dict({"name": "Darkrai"})
+        assert data == PokemonUsageData(name="Darkrai")
+
+
+class TestPreviousMonth:
+    def test_previous_month(self):
+        assert _previous_month("2025-06") == "2025-05"
+
+    def test_previous_month_wraps_year(self):
+        assert _previous_month("2025-01") == "2024-12"
+
+    def test_previous_month_malformed(self):
+        assert _previous_month("latest") is None
+
+
 class TestSmogonStatsLoader:
     def test_loader_init(self):
         loader = SmogonStatsLoader()
@@ -196,3 +222,183 @@ class TestSmogonStatsLoader:
         # With empty cache, should return None
         result = loader.get_pokemon("notapokemon", "gen9ou")
         assert result is None
+
+
+class TestMemoryCache:
+    def test_oldest_format_is_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", lambda *args: SAMPLE_BLOCK)
+        loader = SmogonStatsLoader()
+        formats = [f"gen9format{i}" for i in range(smogon_stats.MEMORY_CACHE_MAX + 1)]
+        for format_id in formats:
+            loader.get_stats(format_id, year_month="2025-01")
+
+        assert len(loader._cache) == smogon_stats.MEMORY_CACHE_MAX
+        assert f"{formats[0]}_1825_2025-01" not in loader._cache
+        assert f"{formats[-1]}_1825_2025-01" in loader._cache
+
+    def test_recently_used_format_survives(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", lambda *args: SAMPLE_BLOCK)
+        loader = SmogonStatsLoader()
+        hot = loader.get_stats("gen9ou", year_month="2025-01")
+        for i in range(smogon_stats.MEMORY_CACHE_MAX):
+            loader.get_stats(f"gen9format{i}", year_month="2025-01")
+            assert loader.get_stats("gen9ou", year_month="2025-01") is hot
+
+        assert "gen9ou_1825_2025-01" in loader._cache
+        assert "gen9format0_1825_2025-01" not in loader._cache
+
+
+class TestMissCaching:
+    @pytest.fixture
+    def fetches(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_fetch(format_id, rating, year_month):
+            calls.append(year_month)
+            return None
+
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", fake_fetch)
+        return calls
+
+    def test_missing_month_is_fetched_once(self, fetches):
+        loader = SmogonStatsLoader()
+        assert loader.get_stats("gen9ou", year_month="2099-01") == {}
+        assert loader.get_stats("gen9ou", year_month="2099-01") == {}
+        assert fetches == ["2099-01", "2098-12"]  # requested month, then the one before
+
+    def test_miss_sentinel_shared_across_loaders(self, fetches, tmp_path):
+        SmogonStatsLoader().get_stats("gen9ou", year_month="2099-01")
+        assert (tmp_path / "stats_gen9ou_1825_2099-01.miss").exists()
+        fetches.clear()
+        assert SmogonStatsLoader().get_stats("gen9ou", year_month="2099-01") == {}
+        assert fetches == []
+
+    def test_previous_month_fallback_is_cached(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_fetch(format_id, rating, year_month):
+            calls.append(year_month)
+            return SAMPLE_BLOCK if year_month == "2025-01" else None
+
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", fake_fetch)
+        loader = SmogonStatsLoader()
+        for _ in range(3):
+            assert "greattusk" in loader.get_stats("gen9ou", year_month="2025-02")
+        assert calls == ["2025-02", "2025-01"]
+
+        # A fresh loader finds the miss sentinel and the previous month on disk
+        assert "greattusk" in SmogonStatsLoader().get_stats("gen9ou", year_month="2025-02")
+        assert calls == ["2025-02", "2025-01"]
+
+    def test_path_like_format_is_rejected(self, fetches, tmp_path, monkeypatch):
+        stats_dir = tmp_path / "stats"
+        stats_dir.mkdir()
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", stats_dir)
+        for format_id in ("../../../escaped", "gen9/ou", "Gen9OU", ""):
+            assert SmogonStatsLoader().get_stats(format_id, year_month="2026-09") == {}
+        assert SmogonStatsLoader().get_stats("gen9ou", year_month="../2026-09") == {}
+        assert fetches == []
+        assert list(tmp_path.rglob("*")) == [stats_dir]
+
+    def test_unknown_formats_do_not_accumulate_state(self, fetches, monkeypatch):
+        monkeypatch.setattr(smogon_stats, "MISS_MAX_AGE_HOURS", 0)
+        loader = SmogonStatsLoader()
+        locks = loader._locks
+        for i in range(50):
+            assert loader.get_stats(f"bogus{i}", year_month="2099-01") == {}
+        # Every earlier miss has expired and been pruned; the lock pool is fixed
+        assert list(loader._misses) == ["bogus49_1825_2098-12"]
+        assert loader._locks is locks and len(locks) == smogon_stats._LOAD_LOCK_STRIPES
+
+    def test_stale_miss_sentinel_refetches(self, fetches, tmp_path):
+        miss = tmp_path / "stats_gen9ou_1825_2099-01.miss"
+        miss.touch()
+        old = miss.stat().st_mtime - (smogon_stats.MISS_MAX_AGE_HOURS + 1) * 3600
+        os.utime(miss, (old, old))
+        SmogonStatsLoader().get_stats("gen9ou", year_month="2099-01")
+        assert fetches
+
+
+class TestUnchangedFetch:
+    def test_identical_text_skips_reparse(self, tmp_path, monkeypatch):
+        parses = []
+        real_parse = smogon_stats._parse_stats
+
+        def counting_parse(raw_text):
+            parses.append(raw_text)
+            return real_parse(raw_text)
+
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", lambda *args: SAMPLE_BLOCK)
+        monkeypatch.setattr(smogon_stats, "_parse_stats", counting_parse)
+
+        first = SmogonStatsLoader().get_stats("gen9ou", year_month="2025-01")
+        cache = tmp_path / "stats_gen9ou_1825_2025-01.json"
+        assert (tmp_path / "stats_gen9ou_1825_2025-01.hash").exists()
+
+        # Age the cache past its freshness window so the next loader refetches
+        old = cache.stat().st_mtime - (smogon_stats.CACHE_MAX_AGE_DAYS + 1) * 86400
+        os.utime(cache, (old, old))
+        second = SmogonStatsLoader().get_stats("gen9ou", year_month="2025-01")
+
+        assert len(parses) == 1
+        assert second == first
+        assert smogon_stats._is_cache_fresh(cache)
+
+    def test_new_stats_notify_listener(self, tmp_path, monkeypatch):
+        texts = iter([SAMPLE_BLOCK, SAMPLE_BLOCK, SAMPLE_BLOCK.replace("619002", "619003")])
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", lambda *args: next(texts))
+        monkeypatch.setattr(smogon_stats, "_is_cache_fresh", lambda path: False)
+
+        notified = []
+        for _ in range(3):
+            loader = SmogonStatsLoader()
+            loader.on_new_stats = lambda: notified.append(True)
+            loader.get_stats("gen9ou", year_month="2025-01")
+        # First parse and the changed text notify; the identical refetch does not
+        assert notified == [True, True]
+
+    def test_unwritable_cache_still_returns_stats(self, tmp_path, monkeypatch):
+        def failing_save(data, cache_path):
+            raise PermissionError(cache_path)
+
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", lambda *args: SAMPLE_BLOCK)
+        monkeypatch.setattr(smogon_stats, "_save_to_cache", failing_save)
+
+        data = SmogonStatsLoader().get_stats("gen9ou", year_month="2025-01")
+        assert "greattusk" in data
+        assert not (tmp_path / "stats_gen9ou_1825_2025-01.hash").exists()
+
+
+class TestPrefetch:
+    @pytest.mark.asyncio
+    async def test_prefetch_loads_each_format_once(self, tmp_path, monkeypatch):
+        fetches = []
+
+        def fake_fetch(format_id, rating, year_month):
+            fetches.append(format_id)
+            return SAMPLE_BLOCK
+
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", fake_fetch)
+        loader = SmogonStatsLoader()
+        await loader.prefetch(["gen9ou", "gen9uu", "gen9ou"])
+
+        assert sorted(fetches) == ["gen9ou", "gen9uu"]
+        assert "greattusk" in loader.get_stats("gen9uu")
+        assert len(fetches) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_stats_async_matches_sync(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(smogon_stats, "STATS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(smogon_stats, "_fetch_stats_text", lambda *args: SAMPLE_BLOCK)
+        loader = SmogonStatsLoader()
+        data = await loader.get_stats_async("gen9ou", year_month="2025-01")
+        assert data is loader.get_stats("gen9ou", year_month="2025-01")
+        assert await loader.get_stats_async("gen9ou", year_month="2025-01") is data